@@ -4,32 +4,41 @@
 # SPDX-License-Identifier: MIT
 # --------------------------------------------------------------------------------------------------
 
-if "bpy" in locals():
-    import importlib
-
-    importlib.reload(properties)  # noqa
-    importlib.reload(operators)  # noqa
-    importlib.reload(node_tree)  # noqa
-    importlib.reload(node_sockets)  # noqa
-    importlib.reload(node_import)  # noqa
-    importlib.reload(node_model)  # noqa
-    importlib.reload(node_mesh)  # noqa
-    importlib.reload(node_animation)  # noqa
-
-else:
-    from . import (
-        properties,
-        operators,
-        node_tree,
-        node_sockets,
-        node_import,
-        node_model,
-        node_mesh,
-        node_animation,
-    )
+import importlib
+import sys
 
 from .core import core
 
+# submodules are imported on demand via the module __getattr__ below so importing the
+# package stays cheap; register() pulls them in when blender actually enables the addon
+_submodule_names = (
+    "properties",
+    "operators",
+    "node_tree",
+    "node_sockets",
+    "node_import",
+    "node_model",
+    "node_mesh",
+    "node_animation",
+)
+
+# reload any submodules that were already imported (script reload)
+for _submodule_name in _submodule_names:
+    if _submodule := sys.modules.get(f"{__package__}.{_submodule_name}"):
+        importlib.reload(_submodule)
+
+
+# --------------------------------------------------------------------------------------------------
+def __getattr__(name):
+    """import a submodule on first access (pep 562)."""
+
+    if name in _submodule_names:
+        submodule = importlib.import_module(f".{name}", __package__)
+        globals()[name] = submodule
+        return submodule
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # --------------------------------------------------------------------------------------------------
 def load_configuration():
@@ -38,33 +47,25 @@ def load_configuration():
     core.Configuration.load_configuration()
 
 
-load_configuration()
-
-
 # --------------------------------------------------------------------------------------------------
 def register():
     """register blender classes."""
-    properties.register()
-    operators.register()
-    node_tree.register()
-    node_sockets.register()
-    node_import.register()
-    node_model.register()
-    node_mesh.register()
-    node_animation.register()
+
+    # the configuration files are read here rather than at import time so importing the
+    # package costs no file io; the submodules are only imported (and so only read the
+    # settings) after this runs
+    load_configuration()
+
+    for submodule_name in _submodule_names:
+        importlib.import_module(f".{submodule_name}", __package__).register()
 
 
 # --------------------------------------------------------------------------------------------------
 def unregister():
     """unregister blender classes."""
-    node_animation.unregister()
-    node_mesh.unregister()
-    node_model.unregister()
-    node_import.unregister()
-    node_sockets.unregister()
-    node_tree.unregister()
-    operators.unregister()
-    properties.unregister()
+
+    for submodule_name in reversed(_submodule_names):
+        importlib.import_module(f".{submodule_name}", __package__).unregister()
 
 
 # --------------------------------------------------------------------------------------------------
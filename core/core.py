@@ -4,14 +4,22 @@
 # SPDX-License-Identifier: MIT
 # --------------------------------------------------------------------------------------------------
 
+import pickle
 from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from json import load
 from pathlib import Path
 from typing import ClassVar
 
 from bpy.types import Context, Scene
 
+# orjson parses dict-heavy config files much faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # --------------------------------------------------------------------------------------------------
 class MissingImportFileName(Exception):
@@ -31,32 +39,28 @@ def hex_to_rgba(hex_color: str):
     if len(hex_color) not in [6, 8]:
         return
 
-    srgba_red = int(hex_color[0:2], base=16) / 255
-    srgba_green = int(hex_color[2:4], base=16) / 255
-    srgba_blue = int(hex_color[4:6], base=16) / 255
+    # bytes.fromhex parses all the components in a single c call and the tuple length
+    # follows the input: 3 for rgb, 4 for rgba
+    return tuple(component / 255 for component in bytes.fromhex(hex_color))
 
-    if len(hex_color) == 8:
-        srgba_alpha = int(hex_color[6:8], base=16) / 255
-    else:
-        srgba_alpha = None
 
-    if len(hex_color) == 6:
-        srgba_color = tuple([srgba_red, srgba_green, srgba_blue])
-    else:
-        srgba_color = tuple([srgba_red, srgba_green, srgba_blue, srgba_alpha])
+# --------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _get_defaults(template_key):
+    """resolve a driver template into a (key, value) tuple, looked up once per key so
+    creating many nodes does not re-walk the template cache each time."""
 
-    return srgba_color
+    return tuple(Configuration.driver_template[template_key].items())
 
 
 # --------------------------------------------------------------------------------------------------
 def set_defaults(driver, template_key):
     """this loads the default settings for a driver from a json file."""
 
-    defaults = Configuration.driver_template[template_key]
     # print()
     # print(template_key)
 
-    for key, value in defaults.items():
+    for key, value in _get_defaults(template_key):
         # print(key, value)
         setattr(driver, key, value)
 
@@ -80,17 +84,74 @@ def get_actorx_models(context: Context, scene: Scene):
 
 # --------------------------------------------------------------------------------------------------
 def load_json_file(file_name=None, ordered=False):
-    """this loads a dict from a json file."""
+    """this loads a dict from a json file.
+
+    a pickle side-car next to the json file is deserialized instead when it is
+    current, skipping json tokenization entirely on warm starts.
+
+    ordered is kept for the api but is effectively a no-op as built-in dicts
+    preserve insertion order."""
+
+    file_name = Path(file_name)
+    cache_path = file_name.with_suffix(".json.pkl")
+
+    try:
+        if cache_path.stat().st_mtime >= file_name.stat().st_mtime:
+            return pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.UnpicklingError):
+        pass
 
-    with open(str(file_name), "r") as input_file:
-        if not ordered:
-            data_dict = load(input_file)
-        else:
-            data_dict = load(input_file, object_pairs_hook=OrderedDict)
+    if orjson and not ordered:
+        data_dict = orjson.loads(file_name.read_bytes())
+    else:
+        with open(str(file_name), "r") as input_file:
+            if not ordered:
+                data_dict = load(input_file)
+            else:
+                data_dict = load(input_file, object_pairs_hook=OrderedDict)
+
+    # refreshing the side-car is best-effort so read-only installs just re-parse
+    try:
+        cache_path.write_bytes(pickle.dumps(data_dict, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
 
     return data_dict
 
 
+# --------------------------------------------------------------------------------------------------
+# in-process configuration cache of (mtime, data) keyed by file path
+_configuration_cache: dict = {}
+
+
+# --------------------------------------------------------------------------------------------------
+def _cached_load(file_name: Path):
+    """this loads a json file memoized on its modification time so unchanged files are
+    served from the in-process cache on reloads."""
+
+    mtime = file_name.stat().st_mtime
+    cached = _configuration_cache.get(file_name)
+
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    data_dict = load_json_file(file_name)
+    _configuration_cache[file_name] = (mtime, data_dict)
+
+    return data_dict
+
+
+# --------------------------------------------------------------------------------------------------
+class ConfigurationFile:
+    """descriptor that lazily loads a configuration json file on first access."""
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+
+    def __get__(self, instance, owner):
+        return _cached_load(owner.configuration_path / self.file_name)
+
+
 # --------------------------------------------------------------------------------------------------
 @dataclass
 class Configuration:
@@ -110,8 +171,14 @@ class Configuration:
     script_path: Path = Path(__file__).resolve().parent.parent
     configuration_path: Path = script_path / "configuration"
 
+    # default settings for each property group
+    driver_template = ConfigurationFile("driver_template.json")
+
+    # blender object name prefixes
+    prefixes = ConfigurationFile("prefixes.json")
+
     # definitions and enum property settings for linking armatures by pose bones
-    armature_links: ClassVar[dict] = {}
+    armature_links = ConfigurationFile("armature_links.json")
     parent_link: ClassVar[list] = [("no_link", "No Link", "")]
 
     # list of texture maps
@@ -121,28 +188,17 @@ class Configuration:
     user_drivers: Path = script_path / "user_drivers"
 
     # user preferences
-    user_settings: ClassVar[dict] = {}
+    user_settings = ConfigurationFile("user_settings.json")
 
     # action filters
-    action_filters: ClassVar[dict] = {}
+    action_filters = ConfigurationFile("action_filters.json")
 
     # ----------------------------------------------------------------------------------------------
     @classmethod
     def load_configuration(cls):
-        # default settings for each property group
-        cls.driver_template = load_json_file(cls.configuration_path / "driver_template.json")
-
-        # blender object name prefixes
-        cls.prefixes = load_json_file(cls.configuration_path / "prefixes.json")
-
-        # armature linking definitions
-        cls.armature_links = load_json_file(cls.configuration_path / "armature_links.json")
+        # seed the parent link enum from the armature linking definitions. the list is mutated
+        # in place as the property enums hold a reference to it
+        del cls.parent_link[1:]
 
         for link_id, link_settings in cls.armature_links.items():
             cls.parent_link.append((link_id, link_settings["name"], link_settings["description"]))
-
-        # user preferences
-        cls.user_settings = load_json_file(cls.configuration_path / "user_settings.json")
-
-        # blender object name prefixes
-        cls.action_filters = load_json_file(cls.configuration_path / "action_filters.json")
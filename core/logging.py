@@ -5,6 +5,7 @@
 
 """console logging. this is old code that has never been tuned well."""
 
+from collections import deque
 from functools import wraps
 
 from mathutils import Quaternion, Vector
@@ -12,6 +13,13 @@ from mathutils import Quaternion, Vector
 suppress_section_headings = False
 suppress_trace_values = False
 
+# log levels. anything below log_level is dropped before formatting happens
+LOG_NONE = 0
+LOG_MESSAGES = 1
+LOG_TRACE = 2
+
+log_level = LOG_TRACE
+
 
 # --------------------------------------------------------------------------------------------------
 # dump the number of psk records to the console for debugging
@@ -43,6 +51,11 @@ class SectionHeader:
 
     # ----------------------------------------------------------------------------------------------
     def __call__(self, func, *args, **kwargs):
+        # when the decorator would never print anything there is no reason to pay for the
+        # wrapper frame; hand the function back untouched
+        if log_level < LOG_TRACE or (not self.print_header and not self.print_leading_line):
+            return func
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             indent = SectionHeader.indent_string * SectionHeader.current_level
@@ -90,6 +103,9 @@ class Echo:
     ):
         """output a message."""
 
+        if log_level < LOG_MESSAGES and not Echo.capture_messages:
+            return
+
         if use_indent:
             indent_string = SectionHeader.get_indent(indent_step=indent_step + self.indent_step)
         else:
@@ -117,6 +133,9 @@ class Echo:
     ):
         """output a padded message and value pair."""
 
+        if log_level < LOG_MESSAGES and not Echo.capture_messages:
+            return
+
         if width is None:
             width = self.width
 
@@ -138,6 +157,14 @@ class Echo:
         if trailing_line:
             self.message()
 
+    # ----------------------------------------------------------------------------------------------
+    def debug(self, message_factory, indent_step: int = 0):
+        """output a deferred trace message. the factory is only called when trace logging
+        is enabled so callers do not pay for string formatting."""
+
+        if log_level >= LOG_TRACE:
+            self.message(message_factory(), indent_step=indent_step)
+
     # ----------------------------------------------------------------------------------------------
     def values(
         self,
@@ -214,51 +241,65 @@ class Echo:
                 self.message(value)
 
         # ------------------------------------------------------------------------------------------
-        # class: do not include dunder methods, class methods or static methods
-        if hasattr(items, "__dict__"):
-            # NOTE: dictionary comprehension with keys and values
-            class_items = {
-                k: v
-                for k, v in items.__dict__.items()
-                if not k.startswith("__") and not isinstance(v, (classmethod, staticmethod))
-            }
+        # iterative depth-first traversal. entries are (kind, indent_step, item, key) and
+        # children are pushed in reverse so the output order matches the old recursion
+        # without a python frame per nesting level
+        base_indent_step = self.indent_step
 
-            Echo.items(self, class_items, width=width)
+        stack = deque([("expand", base_indent_step, items, None)])
 
-        # ------------------------------------------------------------------------------------------
-        # dicts
-        elif isinstance(items, dict):
-            for key, value in items.items():
-                if header := is_container(item=value, key=key):
-                    self.message(header)
+        while stack:
+            kind, indent_step, item, key = stack.pop()
+            self.indent_step = indent_step
 
-                    self.indent_step += 1
-                    Echo.items(self, value, width=width)
-                    self.indent_step -= 1
+            if kind == "header":
+                self.message(item)
+                continue
 
-                else:
-                    echo_basic_type(value=value, key=key)
+            if kind == "basic":
+                echo_basic_type(value=item, key=key)
+                continue
 
-        # ------------------------------------------------------------------------------------------
-        # lists and tuples
-        elif isinstance(items, (list, tuple)):
-            if len(items) > 0:
-                for item in items:
-                    # containers
-                    # NOTE: not sure if this is ever true
-                    if header := is_container(item=item):
-                        self.message(header)
+            # class: do not include dunder methods, class methods or static methods
+            if hasattr(item, "__dict__"):
+                # NOTE: dictionary comprehension with keys and values
+                item = {
+                    k: v
+                    for k, v in item.__dict__.items()
+                    if not k.startswith("__") and not isinstance(v, (classmethod, staticmethod))
+                }
+
+            # dicts
+            if isinstance(item, dict):
+                children = []
+
+                for child_key, value in item.items():
+                    if header := is_container(item=value, key=child_key):
+                        children.append(("header", indent_step, header, None))
+                        children.append(("expand", indent_step + 1, value, None))
+                    else:
+                        children.append(("basic", indent_step, value, child_key))
+
+                stack.extend(reversed(children))
 
-                        self.indent_step += 1
-                        Echo.items(self, item, width=width)
-                        self.indent_step -= 1
+            # lists and tuples
+            elif isinstance(item, (list, tuple)):
+                children = []
 
+                for entry in item:
+                    # containers
+                    # NOTE: not sure if this is ever true
+                    if header := is_container(item=entry):
+                        children.append(("header", indent_step, header, None))
+                        children.append(("expand", indent_step + 1, entry, None))
                     else:
-                        echo_basic_type(value=item)
+                        children.append(("basic", indent_step, entry, None))
 
-        # ------------------------------------------------------------------------------------------
-        # echo all other types as basic
-        else:
-            echo_basic_type(f"items: {items}")
+                stack.extend(reversed(children))
+
+            # echo all other types as basic
+            else:
+                echo_basic_type(f"items: {item}")
 
+        self.indent_step = base_indent_step
         self.capture_messages = False
@@ -0,0 +1,251 @@
+# --------------------------------------------------------------------------------------------------
+# SPDX-FileCopyrightText: 2026 RhyCynn
+#
+# SPDX-License-Identifier: MIT
+# --------------------------------------------------------------------------------------------------
+
+"""numeric kernels for the animation builder.
+
+the numpy implementations are the baseline. when numba is installed the fused per-frame
+kernel is jit-compiled instead, which removes the intermediate array temporaries between
+the quaternion conversion, the matrix chain and the decompose."""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# multiplying a wxyz quaternion array by these signs conjugates it
+quaternion_conjugate_signs = np.array((1.0, -1.0, -1.0, -1.0))
+
+
+# --------------------------------------------------------------------------------------------------
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """convert an (n, 4) wxyz quaternion array to an (n, 4, 4) transformation matrix array.
+    this is the standard quaternion to matrix expansion applied column-wise."""
+
+    w, x, y, z = quaternions[:, 0], quaternions[:, 1], quaternions[:, 2], quaternions[:, 3]
+
+    matrices = np.zeros((len(quaternions), 4, 4), dtype=np.float64)
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - z * w)
+    matrices[:, 0, 2] = 2.0 * (x * z + y * w)
+    matrices[:, 1, 0] = 2.0 * (x * y + z * w)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - x * w)
+    matrices[:, 2, 0] = 2.0 * (x * z - y * w)
+    matrices[:, 2, 1] = 2.0 * (y * z + x * w)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    matrices[:, 3, 3] = 1.0
+
+    return matrices
+
+
+# --------------------------------------------------------------------------------------------------
+def matrices_to_quaternions(matrices: np.ndarray) -> np.ndarray:
+    """convert an (n, 4, 4) transformation matrix array to an (n, 4) wxyz quaternion array.
+    this is the standard branching matrix to quaternion conversion with the branches
+    expressed as masks."""
+
+    m00, m01, m02 = matrices[:, 0, 0], matrices[:, 0, 1], matrices[:, 0, 2]
+    m10, m11, m12 = matrices[:, 1, 0], matrices[:, 1, 1], matrices[:, 1, 2]
+    m20, m21, m22 = matrices[:, 2, 0], matrices[:, 2, 1], matrices[:, 2, 2]
+
+    quaternions = np.empty((len(matrices), 4), dtype=np.float64)
+
+    trace = m00 + m11 + m22
+
+    case_w = trace > 0.0
+    case_x = ~case_w & (m00 > m11) & (m00 > m22)
+    case_y = ~case_w & ~case_x & (m11 > m22)
+    case_z = ~case_w & ~case_x & ~case_y
+
+    s = np.sqrt(trace[case_w] + 1.0) * 2.0
+    quaternions[case_w, 0] = 0.25 * s
+    quaternions[case_w, 1] = (m21[case_w] - m12[case_w]) / s
+    quaternions[case_w, 2] = (m02[case_w] - m20[case_w]) / s
+    quaternions[case_w, 3] = (m10[case_w] - m01[case_w]) / s
+
+    s = np.sqrt(1.0 + m00[case_x] - m11[case_x] - m22[case_x]) * 2.0
+    quaternions[case_x, 0] = (m21[case_x] - m12[case_x]) / s
+    quaternions[case_x, 1] = 0.25 * s
+    quaternions[case_x, 2] = (m01[case_x] + m10[case_x]) / s
+    quaternions[case_x, 3] = (m02[case_x] + m20[case_x]) / s
+
+    s = np.sqrt(1.0 + m11[case_y] - m00[case_y] - m22[case_y]) * 2.0
+    quaternions[case_y, 0] = (m02[case_y] - m20[case_y]) / s
+    quaternions[case_y, 1] = (m01[case_y] + m10[case_y]) / s
+    quaternions[case_y, 2] = 0.25 * s
+    quaternions[case_y, 3] = (m12[case_y] + m21[case_y]) / s
+
+    s = np.sqrt(1.0 + m22[case_z] - m00[case_z] - m11[case_z]) * 2.0
+    quaternions[case_z, 0] = (m10[case_z] - m01[case_z]) / s
+    quaternions[case_z, 1] = (m02[case_z] + m20[case_z]) / s
+    quaternions[case_z, 2] = (m12[case_z] + m21[case_z]) / s
+    quaternions[case_z, 3] = 0.25 * s
+
+    return quaternions
+
+
+# --------------------------------------------------------------------------------------------------
+def keyframe_transforms(positions, quaternions, offset_matrix, conversion_matrix):
+    """compute the location and wxyz rotation keyframe values for one bone's frame run.
+
+    the result is offset @ (T @ R) @ conversion for every frame, decomposed back into
+    translations and quaternions."""
+
+    # T @ R is just the rotation matrix with the translation written into column 3,
+    # so the translation matrices are never built
+    local_matrices = quaternions_to_matrices(quaternions)
+    local_matrices[:, :3, 3] = positions
+
+    keyframe_matrices = offset_matrix @ local_matrices @ conversion_matrix
+
+    return keyframe_matrices[:, :3, 3], matrices_to_quaternions(keyframe_matrices)
+
+
+# --------------------------------------------------------------------------------------------------
+def keyframe_columns(frame_values):
+    """split a raw (n, 8) px py pz qx qy qz qw time keyframe block into float64 (n, 3)
+    positions and (n, 4) wxyz quaternions."""
+
+    return frame_values[:, :3].astype(np.float64), frame_values[:, (6, 3, 4, 5)].astype(np.float64)
+
+
+# --------------------------------------------------------------------------------------------------
+def weights_to_csr(point_indices, bone_indices, weight_values, num_points):
+    """sort the raw weight records by point into a csr layout. starts[i]:starts[i + 1]
+    slices the bone indices and values for point i."""
+
+    order = np.argsort(point_indices, kind="stable")
+
+    starts = np.zeros(num_points + 1, dtype=np.int64)
+    np.cumsum(np.bincount(point_indices, minlength=num_points), out=starts[1:])
+
+    return starts, bone_indices[order], weight_values[order]
+
+
+# --------------------------------------------------------------------------------------------------
+def _weights_to_csr_fused(point_indices, bone_indices, weight_values, num_points):
+    """fused counting-sort variant of weights_to_csr written for numba. stable like the
+    argsort version, but a single pass without the intermediate order array."""
+
+    num_weights = point_indices.shape[0]
+
+    starts = np.zeros(num_points + 1, dtype=np.int64)
+    for weight_index in range(num_weights):
+        starts[point_indices[weight_index] + 1] += 1
+
+    for point_index in range(num_points):
+        starts[point_index + 1] += starts[point_index]
+
+    cursor = starts[:num_points].copy()
+    sorted_bones = np.empty(num_weights, dtype=bone_indices.dtype)
+    sorted_values = np.empty(num_weights, dtype=weight_values.dtype)
+
+    for weight_index in range(num_weights):
+        point_index = point_indices[weight_index]
+        slot = cursor[point_index]
+        sorted_bones[slot] = bone_indices[weight_index]
+        sorted_values[slot] = weight_values[weight_index]
+        cursor[point_index] = slot + 1
+
+    return starts, sorted_bones, sorted_values
+
+
+# --------------------------------------------------------------------------------------------------
+def _keyframe_columns_fused(frame_values):
+    """fused variant of keyframe_columns written for numba. the parallel row loop writes
+    both output arrays in one pass over the raw keyframe block."""
+
+    num_keys = frame_values.shape[0]
+    positions = np.empty((num_keys, 3), dtype=np.float64)
+    quaternions = np.empty((num_keys, 4), dtype=np.float64)
+
+    for key_index in prange(num_keys):
+        positions[key_index, 0] = frame_values[key_index, 0]
+        positions[key_index, 1] = frame_values[key_index, 1]
+        positions[key_index, 2] = frame_values[key_index, 2]
+        quaternions[key_index, 0] = frame_values[key_index, 6]
+        quaternions[key_index, 1] = frame_values[key_index, 3]
+        quaternions[key_index, 2] = frame_values[key_index, 4]
+        quaternions[key_index, 3] = frame_values[key_index, 5]
+
+    return positions, quaternions
+
+
+# --------------------------------------------------------------------------------------------------
+def _keyframe_transforms_fused(positions, quaternions, offset_matrix, conversion_matrix):
+    """fused per-frame variant of keyframe_transforms written for numba. the scalar loop
+    avoids the intermediate (n, 4, 4) temporaries of the vectorized version."""
+
+    num_frames = positions.shape[0]
+    locations = np.empty((num_frames, 3), dtype=np.float64)
+    rotations = np.empty((num_frames, 4), dtype=np.float64)
+
+    local_matrix = np.zeros((4, 4), dtype=np.float64)
+    local_matrix[3, 3] = 1.0
+
+    for frame in range(num_frames):
+        w = quaternions[frame, 0]
+        x = quaternions[frame, 1]
+        y = quaternions[frame, 2]
+        z = quaternions[frame, 3]
+
+        # T @ R is the rotation matrix with the translation written into column 3
+        local_matrix[0, 0] = 1.0 - 2.0 * (y * y + z * z)
+        local_matrix[0, 1] = 2.0 * (x * y - z * w)
+        local_matrix[0, 2] = 2.0 * (x * z + y * w)
+        local_matrix[1, 0] = 2.0 * (x * y + z * w)
+        local_matrix[1, 1] = 1.0 - 2.0 * (x * x + z * z)
+        local_matrix[1, 2] = 2.0 * (y * z - x * w)
+        local_matrix[2, 0] = 2.0 * (x * z - y * w)
+        local_matrix[2, 1] = 2.0 * (y * z + x * w)
+        local_matrix[2, 2] = 1.0 - 2.0 * (x * x + y * y)
+        local_matrix[0, 3] = positions[frame, 0]
+        local_matrix[1, 3] = positions[frame, 1]
+        local_matrix[2, 3] = positions[frame, 2]
+
+        m = offset_matrix @ local_matrix @ conversion_matrix
+
+        locations[frame, 0] = m[0, 3]
+        locations[frame, 1] = m[1, 3]
+        locations[frame, 2] = m[2, 3]
+
+        trace = m[0, 0] + m[1, 1] + m[2, 2]
+
+        if trace > 0.0:
+            s = np.sqrt(trace + 1.0) * 2.0
+            rotations[frame, 0] = 0.25 * s
+            rotations[frame, 1] = (m[2, 1] - m[1, 2]) / s
+            rotations[frame, 2] = (m[0, 2] - m[2, 0]) / s
+            rotations[frame, 3] = (m[1, 0] - m[0, 1]) / s
+        elif m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+            s = np.sqrt(1.0 + m[0, 0] - m[1, 1] - m[2, 2]) * 2.0
+            rotations[frame, 0] = (m[2, 1] - m[1, 2]) / s
+            rotations[frame, 1] = 0.25 * s
+            rotations[frame, 2] = (m[0, 1] + m[1, 0]) / s
+            rotations[frame, 3] = (m[0, 2] + m[2, 0]) / s
+        elif m[1, 1] > m[2, 2]:
+            s = np.sqrt(1.0 + m[1, 1] - m[0, 0] - m[2, 2]) * 2.0
+            rotations[frame, 0] = (m[0, 2] - m[2, 0]) / s
+            rotations[frame, 1] = (m[0, 1] + m[1, 0]) / s
+            rotations[frame, 2] = 0.25 * s
+            rotations[frame, 3] = (m[1, 2] + m[2, 1]) / s
+        else:
+            s = np.sqrt(1.0 + m[2, 2] - m[0, 0] - m[1, 1]) * 2.0
+            rotations[frame, 0] = (m[1, 0] - m[0, 1]) / s
+            rotations[frame, 1] = (m[0, 2] + m[2, 0]) / s
+            rotations[frame, 2] = (m[1, 2] + m[2, 1]) / s
+            rotations[frame, 3] = 0.25 * s
+
+    return locations, rotations
+
+
+if njit is not None:
+    keyframe_columns = njit(cache=True, parallel=True)(_keyframe_columns_fused)
+    keyframe_transforms = njit(cache=True, fastmath=True)(_keyframe_transforms_fused)
+    weights_to_csr = njit(cache=True)(_weights_to_csr_fused)
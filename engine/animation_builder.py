@@ -13,25 +13,24 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..properties import AxAnimationProps
-from dataclasses import dataclass
 
 import bpy
-from mathutils import Matrix
+import numpy as np
 
 from ..core.core import Configuration as config
 from ..core.logging import Echo, SectionHeader
+from ._kernels import keyframe_columns, keyframe_transforms, quaternion_conjugate_signs
 from .blender import get_conversion_matrices, stop_playback
 from .udk_data import AnimData, UBone
 
 axis_roll_from_matrix = bpy.types.Bone.AxisRollFromMatrix
 
-echo = Echo()
-
+# enum value used to bulk-set the keyframe interpolation with foreach_set
+keyframe_interpolation_linear = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items[
+    "LINEAR"
+].value
 
-@dataclass
-class PreviousAnimation:
-    """this is a hack to keep shorter animations from setting the frame end"""
-    frame_end: int = 0
+echo = Echo()
 
 
 # --------------------------------------------------------------------------------------------------------
@@ -45,6 +44,9 @@ def preprocess_psa_bones(target_armature, psa_bones: dict[str, UBone]) -> dict[s
         # set the pose bone for this psa bone
         # if pose_bone is None:
         if not pose_bone:
+            # clear any binding left over from a previous armature; the parsed psa data
+            # can be shared between models
+            psa_bone.pose_bone = None
             echo.value("Pose bone not found for psa bone", value=bone_name, width=46)
 
         else:
@@ -57,8 +59,9 @@ def preprocess_psa_bones(target_armature, psa_bones: dict[str, UBone]) -> dict[s
             else:
                 # if the pose bone's parent's name is in psa_bones,
                 # set the pose bone parent for this psa bone
-                if pose_bone.parent.name in psa_bones:
-                    psa_bone.parent = psa_bones[pose_bone.parent.name]
+                # one .get probe instead of a membership test plus a second lookup
+                if parent_psa_bone := psa_bones.get(pose_bone.parent.name):
+                    psa_bone.parent = parent_psa_bone
 
                 else:
                     echo.value(
@@ -79,17 +82,23 @@ def create_fcurves(
 
     for _, psa_bone in psa_bones.items():
         if psa_bone.pose_bone is not None:
-            data_path = psa_bone.pose_bone.path_from_id("location")
-            psa_bone.fcurves_location = []
-
-            for index in range(3):
-                psa_bone.fcurves_location.append(blender_action.fcurves.new(data_path, index=index))
-
-            data_path = psa_bone.pose_bone.path_from_id("rotation_quaternion")
-            psa_bone.fcurves_rotation = []
-
-            for index in range(4):
-                psa_bone.fcurves_rotation.append(blender_action.fcurves.new(data_path, index=index))
+            # the fcurves belong to the action so they must be created per action, but the
+            # rna data paths never change across actions and are resolved only once
+            if psa_bone.data_path_location is None:
+                psa_bone.data_path_location = psa_bone.pose_bone.path_from_id("location")
+                psa_bone.data_path_rotation = psa_bone.pose_bone.path_from_id(
+                    "rotation_quaternion"
+                )
+
+            psa_bone.fcurves_location = [
+                blender_action.fcurves.new(psa_bone.data_path_location, index=index)
+                for index in range(3)
+            ]
+
+            psa_bone.fcurves_rotation = [
+                blender_action.fcurves.new(psa_bone.data_path_rotation, index=index)
+                for index in range(4)
+            ]
 
     return psa_bones
 
@@ -100,13 +109,16 @@ def build_animation(
     context: bpy.context,
     anim_props: AxAnimationProps,
     armature_object: bpy.types.Armature,
+    anim_data: AnimData = None,
 ):
-    """build the animation and parent it to an armature."""
+    """build the animation and parent it to an armature. anim_data may be passed in
+    already parsed."""
 
     echo.value(message="Importing Animation", width=20, value=anim_props["display_name"])
 
-    anim_data = AnimData(anim_props["file_path"])
-    anim_data.parse_psa_file()
+    if anim_data is None:
+        anim_data = AnimData(anim_props["file_path"])
+        anim_data.parse_psa_file()
     conversion_matrix, conversion_matrix_conjugated = get_conversion_matrices(anim_props)
 
     psa_bones = anim_data.psa_bones
@@ -122,6 +134,41 @@ def build_animation(
 
     psa_bones = preprocess_psa_bones(armature_object, psa_bones)
 
+    # materialize the bone items once; the action loop iterates them several times and
+    # rebuilding dict views plus list unpacking per pass adds up
+    bone_items = tuple(psa_bones.items())
+    num_bones = len(bone_items)
+
+    # hoist the property flags and the per-bone offset matrices out of the keyframe loop
+    # as none of them vary across frames or actions
+    conjugate_root = anim_props["conjugate_root"]
+    conjugate_non_root = anim_props["conjugate_non_root"]
+    use_translation = anim_props["use_translation"]
+
+    conversion_matrix_inverted = conversion_matrix.inverted()
+
+    # numpy views of the conversion matrices used by the batched keyframe math
+    conversion_matrix_np = np.asarray(conversion_matrix, dtype=np.float64)
+    conversion_matrix_conjugated_np = np.asarray(conversion_matrix_conjugated, dtype=np.float64)
+
+    for _, psa_bone in bone_items:
+        if psa_bone.pose_bone is None:
+            continue
+
+        data_bone = psa_bone.data_bone
+        psa_bone.is_root = psa_bone.pose_bone.parent is None
+
+        # cache the custom property for reversed bones as a plain attribute so the bone
+        # loop does not cross the rna id-property layer per action
+        psa_bone.reversed = bool(data_bone.get("reversed", False))
+
+        if psa_bone.is_root:
+            psa_bone.offset_matrix = data_bone.matrix_local.inverted()
+        else:
+            psa_bone.offset_matrix = (
+                data_bone.parent.matrix_local.inverted() @ data_bone.matrix_local
+            ).inverted() @ conversion_matrix_inverted
+
     total_max_raw_frames = 0
 
     total_actions = len(actions)
@@ -140,82 +187,79 @@ def build_animation(
 
         psa_bones = create_fcurves(psa_bones=psa_bones, blender_action=blender_action)
 
-        keyframe_index = 0
         nla_strip_start_frame = total_max_raw_frames
         total_max_raw_frames += action.num_raw_frames
 
-        # create the keyframe points
-        for raw_frame_index in range(action.num_raw_frames):
-            for bone_index, [bone_name, psa_bone] in enumerate(psa_bones.items()):
-                axis_conversion_matrix = conversion_matrix.copy()
+        num_frames = action.num_raw_frames
+
+        # stage the whole action into contiguous (frames, bones, ...) numpy buffers so the
+        # matrix math below runs as batched matmuls instead of per-frame mathutils calls.
+        # the record array is frame-major with one entry per bone (including "skipped"
+        # bones) and holds eight consecutive float32 fields, so a flat float view feeds
+        # the staging kernel and a reshape replaces the running keyframe index
+        frame_values = np.ascontiguousarray(action.anim_key_frames).view(np.float32)
+
+        positions, quaternions = keyframe_columns(frame_values.reshape(-1, 8))
+        positions = positions.reshape(num_frames, num_bones, 3)
+        quaternions = quaternions.reshape(num_frames, num_bones, 4)
+
+        # compute the keyframe values for all frames of a bone in one batch
+        for bone_index, (bone_name, psa_bone) in enumerate(bone_items):
+            if psa_bone.pose_bone is None:
+                continue
+
+            # if the custom property for reversed bones is set then use the conjugated matrix.
+            # a reference assignment is enough as the matrices are only ever read
+            axis_conversion_matrix = (
+                conversion_matrix_conjugated_np if psa_bone.reversed else conversion_matrix_np
+            )
+
+            bone_quaternions = np.ascontiguousarray(quaternions[:, bone_index])
+
+            # each bone only ever uses the plain or the conjugated rotation, never both,
+            # so conjugate the quaternions up front instead of building both matrix sets
+            if conjugate_root if psa_bone.is_root else conjugate_non_root:
+                bone_quaternions = bone_quaternions * quaternion_conjugate_signs
+
+            # root bones apply the unconjugated conversion matrix
+            locations, rotations = keyframe_transforms(
+                np.ascontiguousarray(positions[:, bone_index]),
+                bone_quaternions,
+                np.asarray(psa_bone.offset_matrix, dtype=np.float64),
+                conversion_matrix_np if psa_bone.is_root else axis_conversion_matrix,
+            )
+
+            # split the transformation for the location and rotation fcurves
+            if use_translation:
+                psa_bone.location_keys = locations.astype(np.float32)
+
+            psa_bone.rotation_keys = rotations.astype(np.float32)
+
+        # flush the accumulated keyframes. co is a flat [frame, value] pair list per fcurve
+        keyframe_co = np.empty((num_frames, 2), dtype=np.float32)
+        keyframe_co[:, 0] = np.arange(num_frames, dtype=np.float32)
+        interpolation_values = np.full(num_frames, keyframe_interpolation_linear, dtype=np.int32)
+
+        for _, psa_bone in bone_items:
+            if psa_bone.pose_bone is None:
+                continue
+
+            if use_translation:
+                for index in range(3):
+                    fcurve = psa_bone.fcurves_location[index]
+                    keyframe_co[:, 1] = psa_bone.location_keys[:, index]
+                    fcurve.keyframe_points.add(num_frames)
+                    fcurve.keyframe_points.foreach_set("co", keyframe_co.ravel())
+                    fcurve.keyframe_points.foreach_set("interpolation", interpolation_values)
+                    fcurve.update()
 
-                if psa_bone.pose_bone is not None:
-                    # if the custom property for reversed bones is set then use the conjugated matrix
-                    if psa_bone.pose_bone.bone["reversed"]:
-                        axis_conversion_matrix = conversion_matrix_conjugated
-
-                    data_bone = psa_bone.data_bone
-                    anim_key_frame = action.anim_key_frames[keyframe_index]
-
-                    translation_matrix = Matrix.Translation(anim_key_frame.position)
-                    rotation_matrix = anim_key_frame.orientation.to_matrix().to_4x4()
-                    rotation_matrix_conjugated = (
-                        anim_key_frame.orientation.conjugated().to_matrix().to_4x4()
-                    )
-
-                    if psa_bone.pose_bone.parent is not None:
-                        if not anim_props["conjugate_non_root"]:
-                            rotation_matrix = (
-                                action.anim_key_frames[keyframe_index]
-                                .orientation.to_matrix()
-                                .to_4x4()
-                            )
-                        else:
-                            rotation_matrix = (
-                                action.anim_key_frames[keyframe_index]
-                                .orientation.conjugated()
-                                .to_matrix()
-                                .to_4x4()
-                            )
-
-                        local_matrix = translation_matrix @ rotation_matrix
-
-                        offset_data_bone_matrix = (
-                            data_bone.parent.matrix_local.inverted() @ data_bone.matrix_local
-                        ).inverted() @ conversion_matrix.inverted()
-
-                        keyframe_matrix = (
-                            offset_data_bone_matrix @ local_matrix @ axis_conversion_matrix
-                        )
-
-                    else:
-                        world_matrix = (
-                            translation_matrix @ rotation_matrix_conjugated
-                            if anim_props["conjugate_root"]
-                            else translation_matrix @ rotation_matrix
-                        )
-
-                        offset_data_bone_matrix = data_bone.matrix_local.inverted() @ world_matrix
-
-                        keyframe_matrix = offset_data_bone_matrix @ conversion_matrix
-
-                    # split the transformation for the location and rotation fcurves
-                    pos, rot, _ = keyframe_matrix.decompose()
-
-                    if anim_props["use_translation"]:
-                        for index in range(3):
-                            psa_bone.fcurves_location[index].keyframe_points.insert(
-                                raw_frame_index, pos[index]
-                            ).interpolation = "LINEAR"
-
-                    for index in range(4):
-                        psa_bone.fcurves_rotation[index].keyframe_points.insert(
-                            raw_frame_index, rot[index]
-                        ).interpolation = "LINEAR"
-
-                # advance the keyframe index for "skipped" bones as there is a 1:1 relationship
-                # between the psa bone list and the keyframe list
-                keyframe_index += 1
+            for index in range(4):
+                fcurve = psa_bone.fcurves_rotation[index]
+                keyframe_co[:, 1] = psa_bone.rotation_keys[:, index]
+                fcurve.keyframe_points.add(num_frames)
+                fcurve.keyframe_points.foreach_set("co", keyframe_co.ravel())
+                fcurve.keyframe_points.foreach_set("interpolation", interpolation_values)
+                fcurve.update()
 
         # set the nla track
         nla_track.strips.new(
@@ -230,10 +274,14 @@ def build_animation(
 
     nla_track.mute = True
 
-    if total_max_raw_frames > PreviousAnimation.frame_end:
+    # the previous frame end is kept on the scene so shorter animations imported later
+    # do not shrink the frame range
+    if total_max_raw_frames > context.scene.get("actorx_frame_end", 0):
         context.scene.frame_end = total_max_raw_frames
-        PreviousAnimation.frame_end = total_max_raw_frames
+        context.scene["actorx_frame_end"] = total_max_raw_frames
 
     context.scene.frame_current = 0
 
-    bpy.app.handlers.frame_change_pre.append(stop_playback)
+    # repeated imports must not stack duplicate handlers
+    if stop_playback not in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.append(stop_playback)
@@ -7,6 +7,7 @@
 """TODO: move this code to common.py."""
 
 import sys
+from functools import lru_cache
 
 import bpy
 from bpy_extras.io_utils import axis_conversion
@@ -19,29 +20,42 @@ echo = Echo()
 
 
 # --------------------------------------------------------------------------------------------------
-def get_conversion_matrices(props) -> tuple[type[Matrix], type[Matrix]]:
-    # TODO: move to a common module
+@lru_cache(maxsize=64)
+def _conversion_matrices(
+    from_forward: str, from_up: str, to_forward: str, to_up: str
+) -> tuple[Matrix, Matrix]:
+    """build and cache the conversion matrices for one axis combination. the matrices are
+    frozen as the cached copies are shared between all callers."""
 
     conversion_matrix = axis_conversion(
-        from_forward=props["from_axis_forward"],
-        from_up=props["from_axis_up"],
-        to_forward=props["to_axis_forward"],
-        to_up=props["to_axis_up"],
+        from_forward=from_forward,
+        from_up=from_up,
+        to_forward=to_forward,
+        to_up=to_up,
     ).to_4x4()
 
-    return conversion_matrix, conversion_matrix.to_quaternion().conjugated().to_matrix().to_4x4()
+    conversion_matrix_conjugated = (
+        conversion_matrix.to_quaternion().conjugated().to_matrix().to_4x4()
+    )
+
+    return conversion_matrix.freeze(), conversion_matrix_conjugated.freeze()
 
 
 # --------------------------------------------------------------------------------------------------
-@SectionHeader()
-def build_object_names(display_name: str) -> dict:
-    names: dict = {}
-    prefixes = config.prefixes
+def get_conversion_matrices(props) -> tuple[type[Matrix], type[Matrix]]:
+    # TODO: move to a common module
+
+    return _conversion_matrices(
+        props["from_axis_forward"],
+        props["from_axis_up"],
+        props["to_axis_forward"],
+        props["to_axis_up"],
+    )
 
-    for key, value in prefixes.items():
-        names[key] = f"{value}{display_name}"
 
-    return names
+# --------------------------------------------------------------------------------------------------
+def build_object_names(display_name: str) -> dict:
+    return {key: f"{value}{display_name}" for key, value in config.prefixes.items()}
 
 
 # --------------------------------------------------------------------------------------------------
@@ -60,28 +74,20 @@ def link_object(
 
 
 # --------------------------------------------------------------------------------------------------
-@SectionHeader()
 def get_collection(collection_name: str) -> bpy.types.Collection:
     """this returns a collection, creating one if it doesn't exist."""
 
-    # ----------------------------------------------------------------------------------------------
-    def new_collection(collection_name: str) -> bpy.types.Collection:
-        """create a new collection."""
-
-        collection = bpy.data.collections.new(collection_name)
-        bpy.context.scene.collection.children.link(collection)
+    if collection_name is None:
+        return
 
+    # a single .get probe instead of a membership test plus a second lookup
+    if collection := bpy.data.collections.get(collection_name):
         return collection
 
-    # ----------------------------------------------------------------------------------------------
-    if collection_name is None:
-        return
+    collection = bpy.data.collections.new(collection_name)
+    bpy.context.scene.collection.children.link(collection)
 
-    return (
-        new_collection(collection_name)
-        if collection_name not in bpy.data.collections
-        else bpy.data.collections.get(collection_name)
-    )
+    return collection
 
 
 # --------------------------------------------------------------------------------------------------
@@ -162,13 +168,11 @@ def link_armatures(
         source_bone_object = source_armature.pose.bones.get(source_bone)
         target_bone_object = target_armature.pose.bones.get(target_bone)
 
-        new_constraint = (
-            bpy.data.objects[source_armature.name]
-            .pose.bones[source_bone_object.name]
-            .constraints.new("COPY_TRANSFORMS")
-        )
-        new_constraint.name = "".join(["copy_trans_", target_bone_object.name])
-        new_constraint.target = bpy.data.objects[target_armature.name]
+        # the armature objects and pose bones are already in hand, so use them directly
+        # instead of re-resolving them by name through bpy.data.objects
+        new_constraint = source_bone_object.constraints.new("COPY_TRANSFORMS")
+        new_constraint.name = f"copy_trans_{target_bone_object.name}"
+        new_constraint.target = target_armature
         new_constraint.subtarget = target_bone_object.name
 
     except Exception as e_error:
@@ -196,56 +200,14 @@ def is_backwards_bone(orientation_matrix: Matrix, bone_name: str, use_column: Fa
     else:
         x, y, z = orientation_matrix.row[0]
 
-    rx = round(abs(x), 6)
-    ry = round(abs(y), 6)
-    rz = round(abs(z), 6)
-
-    is_backwards_bone: bool = False
-    messages = []
-
-    messages.append(f"bone_name: {bone_name}")
-    messages.append(f"abs(x): {rx}")
-    messages.append(f"abs(y): {ry}")
-    messages.append(f"abs(z): {rz}")
-
-    if abs(x) > abs(y):
-        messages.append(f"x: {rx} > y: {ry}")
-
-        if abs(x) > abs(z):
-            messages.append(f"  x: {rx} > z: {rz}")
-            if x < 0:
-                messages.append(f"  x: {round(x, 6)} < 0: {bone_name} reversed")
-                is_backwards_bone = True
-
-            # return [True, messages] if x < 0 else [False, None]
-
-        else:
-            messages.append(f"  x: {rx} < z: {rz}")
-            if z < 0:
-                messages.append(f"  z: {round(z, 6)} < 0: {bone_name} reversed")
-                is_backwards_bone = True
-
-            # return [True, messages] if z < 0 else [False, None]
+    # a bone is backwards when the dominant axis component is negative
+    ax, ay, az = abs(x), abs(y), abs(z)
 
+    if ax > ay and ax > az:
+        dominant = x
+    elif ay > az:
+        dominant = y
     else:
-        if abs(y) > abs(z):
-            messages.append(f"y: {ry} > z: {rz}")
-            if y < 0:
-                messages.append(f"  y: {round(y, 6)} < 0: {bone_name} reversed")
-                is_backwards_bone = True
-
-            # return [True, messages] if y < 0 else [False, None]
-
-        else:
-            messages.append(f"y: {ry} < z: {rz}")
-            if z < 0:
-                messages.append(f"  z: {round(z, 6)} < 0: {bone_name} reversed")
-                is_backwards_bone = True
-
-            # return [True, messages] if z < 0 else [False, None]
-
-    # echo.message("")
-    # for message in messages:
-    #     echo.message(message)
+        dominant = z
 
-    return is_backwards_bone
+    return dominant < 0
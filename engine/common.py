@@ -6,30 +6,51 @@
 
 """common functions."""
 
-from collections import OrderedDict
 from json import dump, load
+from pathlib import Path
 from time import localtime, strftime
 
 from ruamel.yaml import YAML
 
+# orjson reads and writes json in one c call; the stdlib module stays as the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# yaml instances are expensive to construct, so one shared loader/dumper pair is built at
+# import. the safe instance uses the c implementation when available; the round-trip
+# instance keeps the dump output identical to what the default YAML() produced
+_yaml_safe = YAML(typ="safe")
+_yaml_round_trip = YAML()
+
 
 # --------------------------------------------------------------------------------------------------
 def load_json_file(file_name=None, ordered=False):
-    """this loads a dict from a json file."""
+    """this loads a dict from a json file.
 
-    with open(str(file_name), "r") as input_file:
-        if not ordered:
-            data_dict = load(input_file)
-        else:
-            data_dict = load(input_file, object_pairs_hook=OrderedDict)
+    ordered is kept for the api but is effectively a no-op as built-in dicts
+    preserve insertion order."""
 
-    return data_dict
+    if orjson:
+        return orjson.loads(Path(file_name).read_bytes())
+
+    with open(str(file_name), "r") as input_file:
+        return load(input_file)
 
 
 # --------------------------------------------------------------------------------------------------
 def dump_json_file(file_name=None, data_dict=None, sort_keys=False):
     """this dumps a dict to a json file."""
 
+    if orjson:
+        options = orjson.OPT_INDENT_2
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+
+        Path(file_name).write_bytes(orjson.dumps(data_dict, option=options))
+        return
+
     with open(str(file_name), "w", encoding="utf-8") as output_file:
         dump(obj=data_dict, fp=output_file, sort_keys=sort_keys, indent=4)
 
@@ -38,10 +59,8 @@ def dump_json_file(file_name=None, data_dict=None, sort_keys=False):
 def load_yaml_file(yaml_file):
     """this loads a dict from a yaml file."""
 
-    yaml = YAML(typ="safe")
-
     with open(str(yaml_file), "r") as input_file:
-        data_dict = yaml.load(input_file)
+        data_dict = _yaml_safe.load(input_file)
 
     return data_dict
 
@@ -50,10 +69,8 @@ def load_yaml_file(yaml_file):
 def dump_yaml_file(yaml_file, data_dict):
     """this dumps a dict to a yaml file."""
 
-    yaml = YAML()
-
     with open(str(yaml_file), "w", encoding="utf-8") as output_file:
-        yaml.dump(data_dict, output_file)
+        _yaml_round_trip.dump(data_dict, output_file)
 
 
 # --------------------------------------------------------------------------------------------------
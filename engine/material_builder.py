@@ -8,6 +8,7 @@
 TODO: load all named textures in the file and add then as unconnected texture nodes."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import bpy
@@ -20,6 +21,15 @@ from ..core.logging import Echo
 echo = Echo()
 
 
+# --------------------------------------------------------------------------------------------------
+def _to_path(file_path: str) -> Path:
+    """wrap a selected file path, only resolving it when it is not already absolute.
+    resolve hits the file system and the file selector hands out absolute paths."""
+
+    path = Path(file_path)
+    return path if path.is_absolute() else path.resolve()
+
+
 # --------------------------------------------------------------------------------------------------
 def build_materials(context: Context, mesh_object: Mesh, prop: dict) -> None:
     ueviewer_mat = prop["ueviewer_mat"]["file_path"]
@@ -38,16 +48,16 @@ def build_materials(context: Context, mesh_object: Mesh, prop: dict) -> None:
     mat_file_path = None
 
     if ueviewer_mat:
-        ueviewer_mat = Path(ueviewer_mat).resolve()
-        mat_file_path = Path(ueviewer_mat).parent
+        ueviewer_mat = _to_path(ueviewer_mat)
+        mat_file_path = ueviewer_mat.parent
     if texture_path:
-        texture_path = Path(texture_path).resolve()
+        texture_path = _to_path(texture_path)
     if diffuse_map:
-        diffuse_map = Path(diffuse_map).resolve()
+        diffuse_map = _to_path(diffuse_map)
     if specular_map:
-        specular_map = Path(specular_map).resolve()
+        specular_map = _to_path(specular_map)
     if normal_map:
-        normal_map = Path(normal_map).resolve()
+        normal_map = _to_path(normal_map)
 
     # if a texture path was specified use it otherwise use the mat file path
     search_path = None
@@ -87,24 +97,51 @@ def build_materials(context: Context, mesh_object: Mesh, prop: dict) -> None:
         texture_maps=texture_maps,
         invert_green_channel=prop["invert_green_channel"],
     )
-    position_nodes(mesh_object=mesh_object, invert_green_channel=True)
+
+
+# --------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=8)
+def _build_texture_index(search_path: str) -> dict[str, str]:
+    """walk the search path once with os.scandir and index every texture file by its
+    lowercase stem. memoized per path so the diffuse, specular and normal lookups of an
+    import (and any later imports from the same folder) share a single directory walk."""
+
+    extensions = {"tga", "dds", "png"}
+    index = {}
+    directories = [search_path]
+
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                else:
+                    stem, separator, extension = entry.name.rpartition(".")
+                    if separator and extension.lower() in extensions:
+                        index.setdefault(stem.lower(), entry.path)
+
+    return index
 
 
 # --------------------------------------------------------------------------------------------------
 def find_texture(search_path: Path, texture_name: str) -> Path | None:
     """locate a texture name with any valid extension in the specified folder and sub-folders."""
 
-    extensions = {".tga", ".dds", ".png"}
+    # most asset trees keep the textures right beside the .mat file, so probe the known
+    # extensions there first. three stat calls against walking the whole tree
+    for extension in (".tga", ".dds", ".png"):
+        if (candidate := search_path / f"{texture_name}{extension}").is_file():
+            return candidate
 
-    # stops at the first texture found
-    return next(
-        (
-            x
-            for x in search_path.rglob("*")
-            if x.suffix in extensions and x.stem.lower() == texture_name.lower()
-        ),
-        None,
-    )
+    if texture_path := _build_texture_index(str(search_path)).get(texture_name.lower()):
+        return Path(texture_path)
+
+    return None
 
 
 # --------------------------------------------------------------------------------------------------
@@ -112,16 +149,22 @@ def read_mat_file(material_file: str) -> dict[str, str] | None:
     """read a ueviewer .mat file and parse the contents."""
 
     # ----------------------------------------------------------------------------------------------
+    shader_types = frozenset(("Diffuse", "Specular", "Normal"))
+
     try:
         with open(material_file, "r") as data_file:
             uev_materials = {}
 
             for line in data_file:
-                shader_type, texture_filename = line.strip().split("=")
+                shader_type, separator, texture_filename = line.strip().partition("=")
 
-                if shader_type in ["Diffuse", "Specular", "Normal"]:
+                if separator and shader_type in shader_types:
                     uev_materials[shader_type] = texture_filename
 
+                    # stop reading once all the shader maps have been seen
+                    if len(uev_materials) == 3:
+                        break
+
             return uev_materials
 
     except OSError as e:
@@ -136,167 +179,132 @@ def read_mat_file(material_file: str) -> dict[str, str] | None:
         raise MatFileReadError from e
 
 
+# hard coded node layout keyed by node name. this is a hack using fixed positions as node
+# dimensions are (0, 0) until the shader editor is opened, and the spacing will be off if
+# the ui scale is anything other than 1.00
+_node_positions = {
+    "Material Output": (600.0, 200.0),
+    "principled_bsdf": (300.0, 200.0),
+    "tex_diffuse": (-100.0, 300.0),
+    "map_normal": (000.0, -100.0),
+    "rgb_combine": (-200.0, -100.0),
+    "invert_green": (-400.0, 000.0),
+    "rgb_separate": (-600.0, -100.0),
+    "tex_normal": (-900.0, 000.0),
+    "tex_specular": (-100.0, -300.0),
+}
+
+
 # --------------------------------------------------------------------------------------------------
 def build_shader_node_tree(
     mesh_object: Object, texture_maps: dict[str, str], invert_green_channel: bool
 ) -> None:
-    """set up the blender shaders from the ueviewer materials."""
+    """set up the blender shaders from the ueviewer materials and position the nodes."""
+
+    # the texture maps are loop-invariant, so load each image once up front instead of per
+    # material. check_existing reuses a datablock already loaded from the same file
+    diffuse_image = specular_image = normal_image = None
+
+    if texture_filename := texture_maps.get("diffuse"):
+        echo.message("Loading Diffuse", indent_step=-1)
+        diffuse_image = bpy.data.images.load(str(texture_filename), check_existing=True)
+
+    if texture_filename := texture_maps.get("specular"):
+        echo.message("Loading Specular", indent_step=-1)
+        specular_image = bpy.data.images.load(str(texture_filename), check_existing=True)
+
+    if texture_filename := texture_maps.get("normal"):
+        echo.message("Loading Normal", indent_step=-1)
+        normal_image = bpy.data.images.load(str(texture_filename), check_existing=True)
+
+    if normal_image:
+        normal_image.colorspace_settings.name = "Non-Color"
+
+    if normal_image and invert_green_channel:
+        echo.message("Invert Normal Green Channel", indent_step=-1)
 
     for blender_material in mesh_object.data.materials:
         # get the material node tree and principled bsdf
         node_tree = blender_material.node_tree
-        principled_bsdf = node_tree.nodes.get("Principled BSDF")
+        nodes = node_tree.nodes
+        principled_bsdf = nodes.get("Principled BSDF")
 
         if not principled_bsdf:
             return
 
         principled_bsdf.name = "principled_bsdf"
 
-        if texture_filename := texture_maps.get("diffuse"):
-            texture_filename = texture_filename.as_posix()
-            echo.message("Loading Diffuse", indent_step=-1)
-            tex_diffuse = node_tree.nodes.new("ShaderNodeTexImage")
+        # create all the nodes first and gather the socket pairs, then make the links in
+        # one batch so the node tree is not revalidated between creates and connects
+        connections = []
+
+        if diffuse_image:
+            tex_diffuse = nodes.new("ShaderNodeTexImage")
             tex_diffuse.name = "tex_diffuse"
             tex_diffuse.label = "Diffuse"
-            diffuse_texture = bpy.data.images.load(str(texture_filename))
-            tex_diffuse.image = diffuse_texture
+            tex_diffuse.image = diffuse_image
+
+            # diffuse texture color and alpha connections
+            connections.append((principled_bsdf.inputs["Base Color"], tex_diffuse.outputs["Color"]))
+            connections.append((principled_bsdf.inputs["Alpha"], tex_diffuse.outputs["Alpha"]))
 
-        if texture_filename := texture_maps.get("specular"):
-            echo.message("Loading Specular", indent_step=-1)
-            tex_specular = node_tree.nodes.new("ShaderNodeTexImage")
+        if specular_image:
+            tex_specular = nodes.new("ShaderNodeTexImage")
             tex_specular.name = "tex_specular"
             tex_specular.label = "Specular"
-            specular_texture = bpy.data.images.load(str(texture_filename))
-            tex_specular.image = specular_texture
+            tex_specular.image = specular_image
 
-        if texture_filename := texture_maps.get("normal"):
-            echo.message("Loading Normal", indent_step=-1)
-            tex_normal = node_tree.nodes.new("ShaderNodeTexImage")
+            # TODO: find a way to add the specular map that works for most situations
+            # connections.append((principled_bsdf.inputs["Specular Tint"], tex_specular.outputs["Color"]))
+            # connections.append((principled_bsdf.inputs["Roughness"], tex_specular.outputs["Alpha"]))
+
+        if normal_image:
+            tex_normal = nodes.new("ShaderNodeTexImage")
             tex_normal.name = "tex_normal"
             tex_normal.label = "Normal"
-            normal_texture = bpy.data.images.load(str(texture_filename))
-            tex_normal.image = normal_texture
+            tex_normal.image = normal_image
+
+            normal_map = nodes.new("ShaderNodeNormalMap")
+            normal_map.name = "map_normal"
+            normal_map.label = "Normal Map"
 
             if invert_green_channel:
-                echo.message("Invert Normal Green Channel", indent_step=-1)
-                rgb_separate = node_tree.nodes.new("ShaderNodeSeparateRGB")
+                rgb_separate = nodes.new("ShaderNodeSeparateRGB")
                 rgb_separate.name = "rgb_separate"
                 rgb_separate.label = "RGB Separate"
 
-                rgb_combine = node_tree.nodes.new("ShaderNodeCombineRGB")
+                rgb_combine = nodes.new("ShaderNodeCombineRGB")
                 rgb_combine.name = "rgb_combine"
                 rgb_combine.label = "RGB Combine"
 
-                invert_green = node_tree.nodes.new("ShaderNodeInvert")
+                invert_green = nodes.new("ShaderNodeInvert")
                 invert_green.name = "invert_green"
                 invert_green.label = "Invert Green"
 
-            normal_map = node_tree.nodes.new("ShaderNodeNormalMap")
-            normal_map.name = "map_normal"
-            normal_map.label = "Normal Map"
-
-        if texture_filename := texture_maps.get("diffuse"):
-            # diffuse texture color connection
-            output_socket = tex_diffuse.outputs["Color"]
-            input_socket = principled_bsdf.inputs["Base Color"]
-            node_tree.links.new(input_socket, output_socket)
-
-            # diffuse texture alpha connection
-            output_socket = tex_diffuse.outputs["Alpha"]
-            input_socket = principled_bsdf.inputs["Alpha"]
-            node_tree.links.new(input_socket, output_socket)
-
-        # TODO: find a way to add the specular map that works for most situations
-        # specular texture color connection
-        # output_socket = tex_specular.outputs["Color"]
-        # input_socket = principled_bsdf.inputs["Specular Tint"]
-        # node_tree.links.new(input_socket, output_socket)
-
-        # specular texture alpha connection
-        # output_socket = tex_specular.outputs["Alpha"]
-        # input_socket = principled_bsdf.inputs["Roughness"]
-        # node_tree.links.new(input_socket, output_socket)
-
-        if texture_filename := texture_maps.get("normal"):
-            if invert_green_channel:
-                # normal texture color connection
-                output_socket = tex_normal.outputs["Color"]
-                input_socket = rgb_separate.inputs["Image"]
-                node_tree.links.new(input_socket, output_socket)
-                tex_normal.image.colorspace_settings.name = "Non-Color"
-
-                # separate rgb connections
-                output_socket = rgb_separate.outputs["R"]
-                input_socket = rgb_combine.inputs["R"]
-                node_tree.links.new(input_socket, output_socket)
-
-                output_socket = rgb_separate.outputs["B"]
-                input_socket = rgb_combine.inputs["B"]
-                node_tree.links.new(input_socket, output_socket)
-
-                output_socket = rgb_separate.outputs["G"]
-                input_socket = invert_green.inputs["Color"]
-                node_tree.links.new(input_socket, output_socket)
-
-                # invert green connection
-                output_socket = invert_green.outputs["Color"]
-                input_socket = rgb_combine.inputs["G"]
-                node_tree.links.new(input_socket, output_socket)
-
-                # combine rgb connection
-                output_socket = rgb_combine.outputs["Image"]
-                input_socket = normal_map.inputs["Color"]
-                node_tree.links.new(input_socket, output_socket)
-
-                # normal map connection
-                output_socket = normal_map.outputs["Normal"]
-                input_socket = principled_bsdf.inputs["Normal"]
-                node_tree.links.new(input_socket, output_socket)
+                # route the normal color through the green channel inversion
+                connections.append((rgb_separate.inputs["Image"], tex_normal.outputs["Color"]))
+                connections.append((rgb_combine.inputs["R"], rgb_separate.outputs["R"]))
+                connections.append((rgb_combine.inputs["B"], rgb_separate.outputs["B"]))
+                connections.append((invert_green.inputs["Color"], rgb_separate.outputs["G"]))
+                connections.append((rgb_combine.inputs["G"], invert_green.outputs["Color"]))
+                connections.append((normal_map.inputs["Color"], rgb_combine.outputs["Image"]))
 
             else:
                 # normal texture color connection
-                output_socket = tex_normal.outputs["Color"]
-                input_socket = normal_map.inputs["Color"]
-                node_tree.links.new(input_socket, output_socket)
-                tex_normal.image.colorspace_settings.name = "Non-Color"
+                connections.append((normal_map.inputs["Color"], tex_normal.outputs["Color"]))
 
-                # normal map connection
-                output_socket = normal_map.outputs["Normal"]
-                input_socket = principled_bsdf.inputs["Normal"]
-                node_tree.links.new(input_socket, output_socket)
+            # normal map connection
+            connections.append((principled_bsdf.inputs["Normal"], normal_map.outputs["Normal"]))
 
+        new_link = node_tree.links.new
+        for input_socket, output_socket in connections:
+            new_link(input_socket, output_socket)
 
-# --------------------------------------------------------------------------------------------------
-def position_nodes(mesh_object: Object, invert_green_channel: bool) -> None:
-    """position the nodes
-
-    this is a hack using hard coded sizes for the nodes as dimensions are (0, 0)
-    until the shader editor is opened
-
-    the spacing will be off if the ui scale is anything other than 1.00."""
+        # lay the nodes out in the same pass instead of rescanning the materials later
+        for node in nodes:
+            if location := _node_positions.get(node.name):
+                node.location = Vector(location)
 
     bpy.context.area.tag_redraw()
 
-    for blender_material in mesh_object.data.materials:
-        # get the material node tree and nodes
-        node_tree = blender_material.node_tree
-        if material_output := node_tree.nodes.get("Material Output"):
-            material_output.location = Vector((600.0, 200.0))
-        if principled_bsdf := node_tree.nodes.get("principled_bsdf"):
-            principled_bsdf.location = Vector((300.0, 200.0))
-        if tex_diffuse := node_tree.nodes.get("tex_diffuse"):
-            tex_diffuse.location = Vector((-100.0, 300.0))
-        if map_normal := node_tree.nodes.get("map_normal"):
-            map_normal.location = Vector((000.0, -100.0))
-        if rgb_combine := node_tree.nodes.get("rgb_combine"):
-            rgb_combine.location = Vector((-200.0, -100.0))
-        if invert_green := node_tree.nodes.get("invert_green"):
-            invert_green.location = Vector((-400.0, 000.0))
-        if rgb_separate := node_tree.nodes.get("rgb_separate"):
-            rgb_separate.location = Vector((-600.0, -100.0))
-        if tex_normal := node_tree.nodes.get("tex_normal"):
-            tex_normal.location = Vector((-900.0, 000.0))
-        if tex_specular := node_tree.nodes.get("tex_specular"):
-            tex_specular.location = Vector((-100.0, -300.0))
 
-    bpy.context.area.tag_redraw()
@@ -8,17 +8,19 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..properties import AxMeshProps, AxModelProps
 
-import bmesh
 import bpy
+import numpy as np
 from bpy_extras.io_utils import axis_conversion
-from mathutils import Vector
+from mathutils import Matrix
 
 from ..core.logging import Echo, SectionHeader
+from ._kernels import weights_to_csr
 from .blender import build_object_names, get_collection, link_object, set_active_object
 from .udk_data import ModelData
 
@@ -27,90 +29,6 @@ axis_roll_from_matrix = bpy.types.Bone.AxisRollFromMatrix
 echo = Echo()
 
 
-# ----------------------------------------------------------------------------------------------
-@SectionHeader()
-def create_mesh(names: dict) -> tuple[bpy.types.Mesh_props, bpy.types.Object, bmesh.types.BMesh]:
-    """create and return a new mesh."""
-
-    mesh_data = bpy.data.meshes.new(names["mesh_data"])
-    mesh_object = bpy.data.objects.new(names["mesh_object"], mesh_data)
-
-    bmesh_data = bmesh.new()
-    bmesh_data.from_mesh(mesh_data)
-
-    return mesh_data, mesh_object, bmesh_data
-
-
-# ----------------------------------------------------------------------------------------------
-@SectionHeader()
-def create_materials(names: dict, mesh_data: bpy.types.Mesh_props, materials: list):
-    """create a blender material with some basic attributes."""
-
-    for _ in materials:
-        blender_material = bpy.data.materials.new(names["material"])
-        blender_material.blend_method = "CLIP"
-        # blender_material.shadow_method = "CLIP"
-        if bpy.app.version < (4, 2, 0):
-            blender_material.shadow_method = "CLIP"
-        blender_material.use_nodes = True
-        mesh_data.materials.append(blender_material)
-
-
-# ----------------------------------------------------------------------------------------------
-@SectionHeader()
-def create_uv_and_deform_layers(
-    names: dict, bmesh_data: bmesh.types.BMesh
-) -> tuple[bmesh.types.BMLoopUV, bmesh.types.BMLayerAccessVert]:
-    """create and return the groups, uv layers and deform layers."""
-
-    uv_layer = bmesh_data.loops.layers.uv.new(names["uv_layer"])
-    deform_layer = bmesh_data.verts.layers.deform.new("deform_layer")
-
-    return uv_layer, deform_layer
-
-
-# ----------------------------------------------------------------------------------------------
-@SectionHeader()
-def create_mesh_modifier(
-    names: dict, mesh_object: bpy.types.Object, target_armature: bpy.types.Object
-):
-    """create and apply a modifier to attach the mesh to an armature."""
-
-    mesh_object.modifiers.new(names["mesh_modifier"], "ARMATURE")
-    mesh_object.parent = target_armature
-    mesh_object.modifiers[names["mesh_modifier"]].object = target_armature
-
-
-# ----------------------------------------------------------------------------------------------
-@SectionHeader()
-def finalize_mesh(mesh_data: bpy.types.Mesh_props, bmesh_data: bmesh.types.BMesh):
-    """convert and free up the bmesh object."""
-
-    bmesh_data.to_mesh(mesh_data)
-    bmesh_data.free()
-
-
-# ----------------------------------------------------------------------------------------------
-@SectionHeader()
-def run_remove_doubles(bmesh_data: bmesh.types.BMesh):
-    """execute the bmesh command to merge vertices."""
-
-    verts_before_remove = len(bmesh_data.verts)
-    bmesh.ops.remove_doubles(bmesh_data, verts=bmesh_data.verts, dist=0.001)
-    verts_after_remove = len(bmesh_data.verts)
-    verts_removed = verts_before_remove - verts_after_remove
-    if verts_removed > 0:
-        echo.value(message="Doubles Removed", value=str(verts_removed))
-
-
-# ----------------------------------------------------------------------------------------------
-@SectionHeader()
-def set_smooth_shading(mesh_object: bpy.types.Object):
-    """set the entire mesh_props to smooth shading."""
-
-    mesh_object.data.polygons.foreach_set("use_smooth", [True] * len(mesh_object.data.polygons))
-
-
 # --------------------------------------------------------------------------------------------------
 @SectionHeader(print_leading_line=True)
 def build_mesh(
@@ -119,8 +37,9 @@ def build_mesh(
     model_props: AxModelProps,
     armature_object: bpy.types.Armature,
     node_type: str,
+    model_data: ModelData = None,
 ):
-    """build the mesh."""
+    """build the mesh. model_data may be passed in already parsed."""
 
     remove_doubles = mesh_props["remove_doubles"]
     smooth_shading = mesh_props["smooth_shading"]
@@ -130,15 +49,17 @@ def build_mesh(
         smooth_shading = model_props["smooth_shading"]
 
     echo.value(message="Importing Mesh", width=20, value=mesh_props["display_name"])
-    mesh_data = ModelData(mesh_props["file_path"])
-    mesh_data.parse_psk_file()
 
-    points = mesh_data.points
-    wedges = mesh_data.wedges
-    faces = mesh_data.faces
-    materials = mesh_data.materials
-    bones = mesh_data.bones
-    weights = mesh_data.weights
+    if model_data is None:
+        model_data = ModelData(mesh_props["file_path"])
+        model_data.parse_psk_file()
+
+    points = model_data.points
+    wedges = model_data.wedges
+    faces = model_data.faces
+    materials = model_data.materials
+    bones = model_data.bones
+    weights = model_data.weights
 
     names = build_object_names(mesh_props["display_name"])
     collection = get_collection(collection_name="actorx_import")
@@ -152,72 +73,150 @@ def build_mesh(
         to_up=props["to_axis_up"],
     ).to_4x4()
 
-    mesh_data, mesh_object, bmesh_data = create_mesh(names=names)
+    mesh_data = bpy.data.meshes.new(names["mesh_data"])
+    mesh_object = bpy.data.objects.new(names["mesh_object"], mesh_data)
     link_object(context=context, collection=collection, blender_object=mesh_object)
     set_active_object(context=context, blender_object=mesh_object)
 
-    create_materials(names=names, mesh_data=mesh_data, materials=materials)
-
-    for weight in weights:
-        points[weight.point_index].weights.append([weight.weight, weight.bone_index])
-
-    uv_layer, deform_layer = create_uv_and_deform_layers(names=names, bmesh_data=bmesh_data)
-
-    for bone in bones:
-        mesh_object.vertex_groups.new(name=bone.name)
-
-    for wedge in wedges:
-        root_correction = False
-        # if driver.root_correction:
-        if root_correction:
-            wedge.bmesh_vertex = bmesh_data.verts.new(wedge.vertex @ conversion_matrix)
-        else:
-            wedge.bmesh_vertex = bmesh_data.verts.new(wedge.vertex)
+    # create the blender materials with some basic attributes. shadow_method was removed
+    # in 4.2; check the version once, not per material
+    use_shadow_method = bpy.app.version < (4, 2, 0)
 
-        # apply the weights
-        for weights in points[wedge.point_index].weights:
-            weight_value = weights[0]
-            bone_index = weights[1]
-            bone_name = bones[bone_index].name
-
-            group_index = mesh_object.vertex_groups[bone_name].index
-            wedge.bmesh_vertex[deform_layer][group_index] = weight_value
+    for _ in range(len(materials)):
+        blender_material = bpy.data.materials.new(names["material"])
+        blender_material.blend_method = "CLIP"
+        if use_shadow_method:
+            blender_material.shadow_method = "CLIP"
+        blender_material.use_nodes = True
+        mesh_data.materials.append(blender_material)
 
-    # avoid checking each face to see if it exists
-    for face in faces:
-        wedge_0 = wedges[face.wedge_0]
-        wedge_1 = wedges[face.wedge_1]
-        wedge_2 = wedges[face.wedge_2]
+    # stage the weights in a csr layout sorted by point instead of appending boxed
+    # [weight, bone] lists onto every point: weight_starts[i]:weight_starts[i + 1] slices
+    # the bone indices and values for point i
+    weight_starts, weight_bones, weight_values = weights_to_csr(
+        weights["point_index"].astype(np.int32),
+        weights["bone_index"].astype(np.int32),
+        np.ascontiguousarray(weights["weight"]),
+        len(points),
+    )
+    weight_starts = weight_starts.tolist()
+    weight_bones = weight_bones.tolist()
+    weight_values = weight_values.tolist()
+
+    # groups are created in bone order so a bone index is also its group index
+    vertex_groups = [mesh_object.vertex_groups.new(name=bone.name) for bone in bones]
+
+    num_wedges = len(wedges)
+    num_faces = len(faces)
+
+    # one coordinate row per wedge, gathered from the point array by the parser's
+    # per-wedge point index table
+    vertex_coordinates = points[model_data.wedge_points]
+
+    root_correction = False
+    # if driver.root_correction:
+    if root_correction and conversion_matrix != Matrix.Identity(4):
+        # one matmul over all wedges instead of a mathutils multiply per vertex. the
+        # conversion matrix is a pure rotation so the 3x3 block is enough, applied with
+        # the same row-vector convention as wedge.vertex @ conversion_matrix
+        vertex_coordinates = vertex_coordinates @ np.asarray(conversion_matrix, dtype=np.float32)[
+            :3, :3
+        ]
+
+    # the mesh keeps one vertex per wedge like the bmesh path did unless remove_doubles
+    # merges them below. the whole vertex block is loaded with one foreach_set instead of
+    # one verts.new call per wedge
+    wedge_vertices = None
 
-        try:
-            bmesh_face = bmesh_data.faces.new(
-                (wedge_1.bmesh_vertex, wedge_0.bmesh_vertex, wedge_2.bmesh_vertex)
+    if remove_doubles:
+        # merge vertices on the same 0.001 grid the bmesh kd-tree pass used, but with a
+        # single numpy unique over the quantized coordinates before the mesh is built
+        quantized = np.round(vertex_coordinates * 1000.0).astype(np.int64)
+        _, unique_first, wedge_vertices = np.unique(
+            quantized, axis=0, return_index=True, return_inverse=True
+        )
+
+        if (doubles_removed := num_wedges - len(unique_first)) > 0:
+            echo.value(message="Doubles Removed", value=str(doubles_removed))
+
+        vertex_coordinates = vertex_coordinates[unique_first]
+
+    mesh_data.vertices.add(len(vertex_coordinates))
+    mesh_data.vertices.foreach_set("co", vertex_coordinates.ravel())
+
+    # the loop vertex indices come straight from the parser's int32 face table, already
+    # in the reordered (wedge_1, wedge_0, wedge_2) loop order the bmesh path used
+    face_wedges = model_data.face_wedges
+    material_indices = faces["mat_index"].astype(np.int32)
+
+    # prevalidate instead of trapping errors per face: drop duplicate faces and
+    # degenerate faces that repeat a wedge, like bmesh faces.new used to reject them
+    _, first_seen = np.unique(np.sort(face_wedges, axis=1), axis=0, return_index=True)
+    keep_mask = np.zeros(num_faces, dtype=bool)
+    keep_mask[first_seen] = True
+    keep_mask &= (
+        (face_wedges[:, 0] != face_wedges[:, 1])
+        & (face_wedges[:, 1] != face_wedges[:, 2])
+        & (face_wedges[:, 0] != face_wedges[:, 2])
+    )
+
+    if not keep_mask.all():
+        echo.value(message="Invalid Faces Dropped", value=str(num_faces - int(keep_mask.sum())))
+        face_wedges = face_wedges[keep_mask]
+        material_indices = material_indices[keep_mask]
+        num_faces = len(face_wedges)
+
+    loop_wedge_table = face_wedges.ravel()
+    loop_vertex_table = (
+        loop_wedge_table if wedge_vertices is None else wedge_vertices[loop_wedge_table]
+    )
+
+    mesh_data.loops.add(num_faces * 3)
+    mesh_data.loops.foreach_set("vertex_index", loop_vertex_table)
+
+    mesh_data.polygons.add(num_faces)
+    mesh_data.polygons.foreach_set("loop_start", np.arange(0, num_faces * 3, 3, dtype=np.int32))
+    mesh_data.polygons.foreach_set("material_index", material_indices)
+
+    uv_layer = mesh_data.uv_layers.new(name=names["uv_layer"])
+
+    # gather the per-wedge uvs through the loop table and write the whole layer with one
+    # foreach_set instead of assigning loop by loop
+    wedge_us = wedges["u"]
+    wedge_vs = wedges["v"]
+
+    uv_buffer = np.empty((num_faces * 3, 2), dtype=np.float32)
+    uv_buffer[:, 0] = wedge_us[loop_wedge_table]
+    uv_buffer[:, 1] = 1.0 - wedge_vs[loop_wedge_table]
+    uv_layer.data.foreach_set("uv", uv_buffer.ravel())
+
+    # group the wedge indices by (bone, weight value) so every vertex group is filled
+    # with a few bulk add calls instead of one call per wedge weight
+    vertex_indices = range(num_wedges) if wedge_vertices is None else wedge_vertices.tolist()
+
+    group_batches = defaultdict(list)
+    for vertex_index, point_index in zip(vertex_indices, model_data.wedge_points.tolist()):
+        for weight_offset in range(weight_starts[point_index], weight_starts[point_index + 1]):
+            group_batches[(weight_bones[weight_offset], weight_values[weight_offset])].append(
+                vertex_index
             )
-            bmesh_face.material_index = face.mat_index
-
-            uv_0 = Vector((wedge_0.u, 1.0 - wedge_0.v))
-            uv_1 = Vector((wedge_1.u, 1.0 - wedge_1.v))
-            uv_2 = Vector((wedge_2.u, 1.0 - wedge_2.v))
-
-            bmesh_face.loops[0][uv_layer].uv = uv_1
-            bmesh_face.loops[1][uv_layer].uv = uv_0
-            bmesh_face.loops[2][uv_layer].uv = uv_2
 
-        except ValueError as e:
-            echo.value("An error occurred during face creation and will be ignored", str(e))
-            pass
-
-    bmesh_data.faces.index_update()
-
-    if remove_doubles:
-        run_remove_doubles(bmesh_data=bmesh_data)
+    for (bone_index, weight_value), wedge_indices in group_batches.items():
+        vertex_groups[bone_index].add(wedge_indices, weight_value, "REPLACE")
 
-    finalize_mesh(mesh_data=mesh_data, bmesh_data=bmesh_data)
+    # faces collapsed by the vertex merge or anything else left over is cleaned up here
+    mesh_data.validate(verbose=False)
+    mesh_data.update()
 
     if armature_object:
-        create_mesh_modifier(names=names, mesh_object=mesh_object, target_armature=armature_object)
+        # attach the mesh to the armature with a modifier
+        mesh_object.modifiers.new(names["mesh_modifier"], "ARMATURE")
+        mesh_object.parent = armature_object
+        mesh_object.modifiers[names["mesh_modifier"]].object = armature_object
 
     if smooth_shading:
-        set_smooth_shading(mesh_object=mesh_object)
+        # a numpy bool buffer avoids allocating a boxed python list per polygon
+        polygons = mesh_data.polygons
+        polygons.foreach_set("use_smooth", np.ones(len(polygons), dtype=np.bool_))
 
     return mesh_object
@@ -15,9 +15,11 @@ if TYPE_CHECKING:
     from ..properties import AxModel
 
 import bpy
-from mathutils import Matrix, Vector
+import numpy as np
+from mathutils import Matrix, Quaternion, Vector
 
 from ..core.logging import Echo, SectionHeader
+from ._kernels import quaternion_conjugate_signs, quaternions_to_matrices
 from .blender import (
     build_object_names,
     get_collection,
@@ -90,18 +92,25 @@ def create_armature(names: dict) -> tuple[bpy.types.Object, bpy.types.Armature]:
 
 # --------------------------------------------------------------------------------------------------
 @SectionHeader(print_leading_line=True)
-def build_model(context: bpy.types.Context, model_props: AxModel):
-    """build the model."""
+def build_model(context: bpy.types.Context, model_props: AxModel, model_data: ModelData = None):
+    """build the model. model_data may be passed in already parsed."""
 
     echo.value(message="Importing Model", width=20, value=model_props["display_name"])
-    model_data = ModelData(model_props["file_path"])
-    model_data.parse_psk_file()
+
+    if model_data is None:
+        model_data = ModelData(model_props["file_path"])
+        model_data.parse_psk_file()
+
     create_actorx_custom_joint()
 
     names = build_object_names(model_props["display_name"])
     collection = get_collection(collection_name="actorx_import")
     conversion_matrix, conversion_matrix_conjugated = get_conversion_matrices(model_props)
 
+    # when the axis mapping resolves to the identity matrix the per-bone multiply below
+    # is a no-op, so skip it entirely
+    identity_conversion = conversion_matrix == Matrix.Identity(4)
+
     armature_object, armature_data = create_armature(names=names)
 
     link_object(
@@ -114,62 +123,87 @@ def build_model(context: bpy.types.Context, model_props: AxModel):
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode="EDIT", toggle=False)
 
-    for index, psk_bone in enumerate(model_data.bones):
-        axis_conversion_matrix = conversion_matrix.copy()
-        translation_matrix = Matrix.Translation(psk_bone.position)
-        rotation_matrix = psk_bone.orientation.to_matrix().to_4x4()
-        rotation_matrix_conjugated = psk_bone.orientation.conjugated().to_matrix().to_4x4()
+    bones = model_data.bones
+    num_bones = len(bones)
 
-        edit_bone = armature_data.edit_bones.new(psk_bone.name)
-        edit_bone["reversed"] = False
+    conjugate_root = model_props["conjugate_root"]
+    conjugate_non_root = model_props["conjugate_non_root"]
+    detect_reversed_bones = model_props["detect_reversed_bones"]
+    builder = model_props["builder"]
+
+    plus_vector = {
+        "100": Vector((1, 0, 0)),
+        "010": Vector((0, 1, 0)),
+        "001": Vector((0, 0, 1)),
+    }.get(model_props["plus_vector"])
+
+    # compose the local bone matrices in one numpy batch: conjugate the quaternions where
+    # the properties ask for it, convert them to rotation matrices and write the
+    # translations into column 3. the parser exposes the wxyz and position columns
+    # directly; the copy keeps the conjugation below off the shared parse data
+    quaternions = model_data.bone_quaternions.copy()
+
+    is_plain_root = num_bones > 0 and bones[0].parent_index == 0
+
+    if conjugate_non_root and num_bones > 1:
+        quaternions[1:] *= quaternion_conjugate_signs
+
+    if num_bones and (conjugate_root if is_plain_root else conjugate_non_root):
+        quaternions[0] *= quaternion_conjugate_signs
+
+    local_matrices = quaternions_to_matrices(quaternions)
+    local_matrices[:, :3, 3] = model_data.bone_positions
+
+    # the world pass stays serial because of the parent topology, but each step is a
+    # single numpy 4x4 matmul instead of a chain of mathutils calls
+    world_matrices = np.empty_like(local_matrices)
 
+    for index, psk_bone in enumerate(bones):
         if index == 0 and psk_bone.parent_index == 0:
-            world_matrix = (
-                translation_matrix @ rotation_matrix_conjugated
-                if model_props["conjugate_root"]
-                else translation_matrix @ rotation_matrix
-            )
+            world_matrices[0] = local_matrices[0]
         else:
-            parent_bone = model_data.bones[psk_bone.parent_index]
+            world_matrices[index] = world_matrices[psk_bone.parent_index] @ local_matrices[index]
+
+    for index, psk_bone in enumerate(bones):
+        axis_conversion_matrix = conversion_matrix
+
+        edit_bone = armature_data.edit_bones.new(psk_bone.name)
+        edit_bone["reversed"] = False
+
+        if not (index == 0 and psk_bone.parent_index == 0):
             edit_bone.parent = armature_data.edit_bones[psk_bone.parent_index]
 
-            local_matrix = (
-                translation_matrix @ rotation_matrix_conjugated
-                if model_props["conjugate_non_root"]
-                else translation_matrix @ rotation_matrix
-            )
-            world_matrix = parent_bone.world_matrix @ local_matrix
+            if detect_reversed_bones and psk_bone.num_children == 0:
+                # the parser keeps only the raw floats; the quaternion is built here for
+                # the few leaf bones that reach the check
+                orientation = Quaternion((psk_bone.qw, psk_bone.qx, psk_bone.qy, psk_bone.qz))
 
-            if model_props["detect_reversed_bones"] and psk_bone.num_children == 0:
                 if is_backwards_bone(
-                    orientation_matrix=psk_bone.orientation.to_matrix().to_3x3(),
+                    orientation_matrix=orientation.to_matrix().to_3x3(),
                     bone_name=psk_bone.name,
                     use_column=False,
                 ):
                     axis_conversion_matrix = conversion_matrix_conjugated
                     edit_bone["reversed"] = True
 
+        world_matrix = Matrix(world_matrices[index].tolist())
         psk_bone.world_matrix = world_matrix
         edit_bone.head = world_matrix.to_translation()
-        axis_conversion_world_matrix = world_matrix @ axis_conversion_matrix
-
-        plus_vector = {
-            "100": Vector((1, 0, 0)),
-            "010": Vector((0, 1, 0)),
-            "001": Vector((0, 0, 1)),
-        }.get(model_props["plus_vector"])
+        axis_conversion_world_matrix = (
+            world_matrix if identity_conversion else world_matrix @ axis_conversion_matrix
+        )
 
-        if model_props["builder"] == "direct_matrix":
+        if builder == "direct_matrix":
             edit_bone.tail = edit_bone.head + plus_vector * 0.6
             edit_bone.matrix = axis_conversion_world_matrix
 
-        elif model_props["builder"] == "axis_roll":
+        elif builder == "axis_roll":
             (_, rot, _) = axis_conversion_world_matrix.decompose()
             axis, roll_angle = axis_roll_from_matrix(rot.to_matrix().to_3x3())
             edit_bone.tail = axis + edit_bone.head
             edit_bone.roll = roll_angle
 
-        elif model_props["builder"] == "align_roll":
+        elif builder == "align_roll":
             (_, rot, _) = world_matrix.decompose()
             edit_bone.tail = (
                 edit_bone.head
@@ -183,11 +217,13 @@ def build_model(context: bpy.types.Context, model_props: AxModel):
 
     pose_bones = armature_object.pose.bones
     if model_props["show_bones_as_joints"]:
+        # one datablock lookup for all bones
+        custom_joint = bpy.data.objects.get("actorx_custom_joint")
+
         for pose_bone in pose_bones:
-            pose_bone.custom_shape = bpy.data.objects.get("actorx_custom_joint")
+            pose_bone.custom_shape = custom_joint
 
-            pose_bone.custom_shape_scale_xyz = Vector(
-                [pose_bone.length * 0.3, pose_bone.length * 0.3, pose_bone.length * 0.3]
-            )
+            joint_scale = pose_bone.length * 0.3
+            pose_bone.custom_shape_scale_xyz = (joint_scale, joint_scale, joint_scale)
 
     return armature_object
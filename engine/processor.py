@@ -4,6 +4,8 @@
 # SPDX-License-Identifier: MIT
 # --------------------------------------------------------------------------------------------------
 
+from concurrent.futures import ThreadPoolExecutor
+
 import bpy
 
 from ..core.core import Configuration as config
@@ -13,24 +15,90 @@ from .blender import link_armatures
 from .material_builder import build_materials
 from .mesh_builder import build_mesh
 from .model_builder import build_model
+from .udk_data import AnimData, ModelData
 
 echo = Echo()
 
 
+# --------------------------------------------------------------------------------------------------
+def _parse_model_file(file_path: str) -> ModelData:
+    """parse one psk file. runs on a worker thread."""
+
+    model_data = ModelData(file_path)
+    model_data.parse_psk_file()
+
+    return model_data
+
+
+# --------------------------------------------------------------------------------------------------
+def _parse_anim_file(file_path: str) -> AnimData:
+    """parse one psa file. runs on a worker thread."""
+
+    anim_data = AnimData(file_path)
+    anim_data.parse_psa_file()
+
+    return anim_data
+
+
+# --------------------------------------------------------------------------------------------------
+def preparse_import_files(import_dict: dict) -> tuple[dict[str, ModelData], dict[str, AnimData]]:
+    """parse every psk and psa file of the import up front on a thread pool.
+
+    the blender graph build below stays on the main thread as bpy is not thread safe;
+    only the file parsing is overlapped. a model and its meshes sharing a file also
+    share the parsed data."""
+
+    model_paths = []
+    anim_paths = []
+    seen_paths = set()
+
+    # ----------------------------------------------------------------------------------------------
+    def collect(prop, file_paths):
+        if (file_path := prop["file_path"]) and file_path not in seen_paths:
+            seen_paths.add(file_path)
+            file_paths.append(file_path)
+
+    # ----------------------------------------------------------------------------------------------
+    for model in import_dict["model_list"]:
+        collect(model, model_paths)
+        for mesh in model["mesh_list"]:
+            collect(mesh, model_paths)
+        for animation in model["animation_list"]:
+            collect(animation, anim_paths)
+
+    for mesh in import_dict["mesh_list"]:
+        collect(mesh, model_paths)
+
+    if len(model_paths) + len(anim_paths) < 2:
+        return {}, {}
+
+    with ThreadPoolExecutor() as executor:
+        model_futures = {path: executor.submit(_parse_model_file, path) for path in model_paths}
+        anim_futures = {path: executor.submit(_parse_anim_file, path) for path in anim_paths}
+
+        return (
+            {path: future.result() for path, future in model_futures.items()},
+            {path: future.result() for path, future in anim_futures.items()},
+        )
+
+
 # --------------------------------------------------------------------------------------------------
 def walk_import_dict(context, import_dict: dict):
     """traverse the import dictionary and load the models, meshes and animations."""
 
+    parsed_models, parsed_anims = preparse_import_files(import_dict)
+
     # models are in a flat list due to the way blenders pointer properties and collections work
     # linked / nested models are connected by names
     for model in import_dict["model_list"]:
-        armature_object = build_model(context, model)
+        armature_object = build_model(context, model, model_data=parsed_models.get(model["file_path"]))
         mesh_object = build_mesh(
             context=context,
             mesh_props=model,
             model_props=model,
             armature_object=armature_object,
             node_type="Model",
+            model_data=parsed_models.get(model["file_path"]),
         )
         build_materials(context=context, mesh_object=mesh_object, prop=model)
 
@@ -62,12 +130,18 @@ def walk_import_dict(context, import_dict: dict):
                 model_props=model,
                 armature_object=armature_object,
                 node_type="Mesh",
+                model_data=parsed_models.get(mesh["file_path"]),
             )
             build_materials(context=context, mesh_object=mesh_object, prop=mesh)
 
         # adding multiple animations to the same model is experimental
         for animation in model["animation_list"]:
-            build_animation(context, animation, armature_object)
+            build_animation(
+                context,
+                animation,
+                armature_object,
+                anim_data=parsed_anims.get(animation["file_path"]),
+            )
 
     for mesh in import_dict["mesh_list"]:
         mesh_object = build_mesh(
@@ -76,5 +150,6 @@ def walk_import_dict(context, import_dict: dict):
             model_props=None,
             armature_object=None,
             node_type="Mesh",
+            model_data=parsed_models.get(mesh["file_path"]),
         )
         build_materials(context=context, mesh_object=mesh_object, prop=mesh)
@@ -8,74 +8,157 @@
 armature, mesh and animation creation."""
 
 import struct
-from dataclasses import dataclass, field
-from itertools import islice
+from dataclasses import dataclass
 
 import bpy  # type: ignore  # NOQA
-from mathutils import Quaternion, Vector
+import numpy as np
 
 from ..core.logging import Echo, debug_dump
 
 echo = Echo()
 
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
-class UChunkHeader:
-    """chunk_id: ACTRHEAD, ANIMHEAD:
-    A header with an ID, record size and record count."""
-
-    # ----------------------------------------------------------------------------------------------
-    chunk_id: str
-    type_flag: int
-    data_size: int
-    data_count: int
-
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
-class UPoint:
-    """A vertex."""
-
-    vertex: list
-    bmesh_vertex: None  # internal
-    weights: list  # internal
-
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
-class UWedge:
-    """chunk_id: VTXW0000:
-    UDK: Vertex with texturing info, akin to Hoppe's 'Wedge' concept."""
-
-    # ----------------------------------------------------------------------------------------------
-    point_index: int  # pointer to vertex
-    u: int  # texture U coordinate
-    v: int  # texture V coordinate
-    mat_index: int  # unused: udk, ActorX
-    reserved: int  # unused: udk: reserved
-    pad2: int  # padding
-    vertex: int = 0  # internal: vertex for the UPoint at point_index
-    bmesh_vertex: int = 0  # internal: bmesh vertex for the UPoint at point_index
+# structured dtypes mirroring the binary chunk record layouts. each chunk is decoded with
+# a single np.frombuffer call over its raw bytes instead of a python loop that unpacks and
+# boxes one record object at a time, so the parse is one pass over memory in c
+
+# chunk_id: PNTS0000: a vertex
+point_dtype = np.dtype("<3f4")
+
+# chunk_id: VTXW0000: vertex with texturing info, akin to Hoppe's 'Wedge' concept.
+# the 16 bit layout is used when there are 65536 or fewer records
+wedge16_dtype = np.dtype(
+    [
+        ("point_index", "<u2"),  # pointer to vertex
+        ("pad1", "<i2"),  # padding
+        ("u", "<f4"),  # texture U coordinate
+        ("v", "<f4"),  # texture V coordinate
+        ("mat_index", "u1"),  # unused: udk, ActorX
+        ("reserved", "u1"),  # unused: udk: reserved
+        ("pad2", "<u2"),  # padding
+    ]
+)
+wedge32_dtype = np.dtype(
+    [
+        ("point_index", "<u4"),  # pointer to vertex
+        ("u", "<f4"),  # texture U coordinate
+        ("v", "<f4"),  # texture V coordinate
+        ("mat_index", "u1"),  # unused: udk, ActorX
+        ("reserved", "u1"),  # unused: udk: reserved
+        ("pad2", "<u2"),  # padding
+    ]
+)
+
+# chunk_id: FACE0000 / FACE3200: a textured triangle
+face16_dtype = np.dtype(
+    [
+        ("wedge_0", "<u2"),  # pointer to wedge
+        ("wedge_1", "<u2"),  # pointer to wedge
+        ("wedge_2", "<u2"),  # pointer to wedge
+        ("mat_index", "u1"),  # pointer to material
+        ("aux_mat_index", "u1"),  # unused: udk: unused
+        ("smoothing_groups", "<u4"),  # unused: 32-bit flag for smoothing groups
+    ]
+)
+face32_dtype = np.dtype(
+    [
+        ("wedge_0", "<u4"),
+        ("wedge_1", "<u4"),
+        ("wedge_2", "<u4"),
+        ("mat_index", "u1"),
+        ("aux_mat_index", "u1"),
+        ("smoothing_groups", "<u4"),
+    ]
+)
+
+# chunk_id: RAWWEIGHTS: raw data bone influence
+weight_dtype = np.dtype(
+    [
+        ("weight", "<f4"),  # weight value
+        ("point_index", "<u4"),  # pointer to point
+        ("bone_index", "<u4"),  # pointer to bone
+    ]
+)
+
+# chunk_id: EXTRAUVS0: additional UV sets created by ueviewer
+extra_uv_dtype = np.dtype([("u", "<u4"), ("v", "<u4")])
+
+# chunk_id: ANIMKEYS: an animation key. position and orientation relative to parent
+keyframe_dtype = np.dtype(
+    [
+        ("px", "<f4"),  # vector x
+        ("py", "<f4"),  # vector y
+        ("pz", "<f4"),  # vector z
+        ("qx", "<f4"),  # quaternion x
+        ("qy", "<f4"),  # quaternion y
+        ("qz", "<f4"),  # quaternion z
+        ("qw", "<f4"),  # quaternion w
+        ("time", "<f4"),  # unused: udk: duration until next key
+    ]
+)
+
+# chunk_id: SCALEKEYS
+scale_key_dtype = np.dtype([("px", "<f4"), ("py", "<f4"), ("pz", "<f4"), ("time", "<f4")])
+
+# chunk_id: MATT0000: raw data material
+material_dtype = np.dtype(
+    [
+        ("name", "S64"),  # voof
+        ("texture_index", "<u4"),  # unused ActorX: udk: multiskin index
+        ("poly_flags", "<u4"),  # unused ActorX: udk: polys with this material have this flag
+        ("aux_material", "<u4"),  # unused: udk: reserved
+        ("aux_flags", "<u4"),  # unused: udk: reserved
+        ("lod_bias", "<i4"),  # unused: udk: unused
+        ("lod_style", "<i4"),  # unused: udk: unused
+    ]
+)
+
+# chunk_id: REFSKELT / BONENAMES: a bone: an orientation, and a position, all relative
+# to their parent
+bone_dtype = np.dtype(
+    [
+        ("name", "S64"),  # voof
+        ("flags", "<u4"),  # unused: udk: reserved
+        ("num_children", "<i4"),  # unused: udk: unused
+        ("parent_index", "<i4"),  # index to parent bone, 0 or null if root
+        ("qx", "<f4"),  # quaternion x
+        ("qy", "<f4"),  # quaternion y
+        ("qz", "<f4"),  # quaternion z
+        ("qw", "<f4"),  # quaternion w
+        ("px", "<f4"),  # vector x
+        ("py", "<f4"),  # vector y
+        ("pz", "<f4"),  # vector z
+        ("length", "<f4"),  # unused: udk: unused
+        ("sx", "<f4"),  # vector x
+        ("sy", "<f4"),  # vector y
+        ("sz", "<f4"),  # vector z
+    ]
+)
+
+# chunk_id: ANIMINFO: binary animation info format
+action_dtype = np.dtype(
+    [
+        ("name", "S64"),  # voof
+        ("group", "S64"),  # group name, used as action name
+        ("total_bones", "<i4"),  # udk: number of animation keys = total_bones * num_raw_frames
+        ("root_include", "<i4"),  # unused: udk unused
+        ("key_compression_style", "<i4"),  # unused: udk reserved
+        ("key_quotum", "<i4"),  # unused ActorX: udk: max key quotum for compression
+        ("key_reduction", "<f4"),  # unused ActorX: udk: desired
+        ("track_time", "<f4"),  # unused ActorX: udk: explicit, overridable by animation rate
+        ("anim_rate", "<f4"),  # unused: udk: fps
+        ("start_bone", "<i4"),  # unused: udk: reserved, unused
+        ("first_raw_frame", "<i4"),  # unused ActorX: udk: no description
+        ("num_raw_frames", "<i4"),  # total frames for the track (not keyframes)
+    ]
+)
+
+# the chunk header is the one record still decoded through the struct module; the
+# precompiled module-level Struct parses its format string once instead of per call
+header_struct = struct.Struct("<20sLLL")
 
 
 # --------------------------------------------------------------------------------------------------
-@dataclass
-class UFace:
-    """chunk_id: FACE0000:
-    UDK: Textured triangle."""
-
-    # ----------------------------------------------------------------------------------------------
-    wedge_0: int  # pointer to UWedge
-    wedge_1: int  # pointer to UWedge
-    wedge_2: int  # pointer to UWedge
-    mat_index: int  # pointer to material
-    aux_mat_index: int  # unused: udk: unused
-    smoothing_groups: int  # unused: 32-bit flag for smoothing groups
-
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class UMaterial:
     """chunk_id: MATT0000:
     UDK: Raw data material."""
@@ -91,7 +174,7 @@ class UMaterial:
 
 
 # --------------------------------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class UBone:
     """chunk_id: REFSKELT:
     UDK: A bone: an orientation, and a position, all relative to their parent."""
@@ -113,43 +196,25 @@ class UBone:
     sx: float  # vector x
     sy: float  # vector y
     sz: float  # vector z
-    position: Vector = None  # position relative to parent
-    orientation: Quaternion = None  # orientation (rotation) relative to parent
-    pose_bone = None  # internal:
-    data_bone = None  # internal:
-    parent = None  # internal:
-    world_matrix = None  # internal:
-    world_translation = None  # internal:
-    world_rotation = None  # internal:
-    # fcurves_location = dict()
-    # fcurves_rotation = dict()
+    pose_bone: object = None  # internal:
+    data_bone: object = None  # internal:
+    parent: object = None  # internal:
+    world_matrix: object = None  # internal:
+    world_translation: object = None  # internal:
+    world_rotation: object = None  # internal:
+    is_root: bool = None  # internal: the pose bone has no parent
+    reversed: bool = None  # internal: cached "reversed" custom property from the data bone
+    offset_matrix: object = None  # internal: precomputed rest offset for animation keyframes
+    location_keys: object = None  # internal: accumulated location keyframe values per action
+    rotation_keys: object = None  # internal: accumulated rotation keyframe values per action
+    data_path_location: str = None  # internal: cached rna data path for the location fcurves
+    data_path_rotation: str = None  # internal: cached rna data path for the rotation fcurves
+    fcurves_location: list = None  # internal: location fcurves of the current action
+    fcurves_rotation: list = None  # internal: rotation fcurves of the current action
 
 
 # --------------------------------------------------------------------------------------------------
-@dataclass
-class UWeight:
-    """chunk_id: RAWWEIGHTS:
-    UDK: Raw data bone influence."""
-
-    # ----------------------------------------------------------------------------------------------
-    weight: float  # weight value
-    point_index: int  # pointer to UPoint
-    bone_index: int  # pointer to UBone
-
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
-class UExtraUV:
-    """chunk_id: EXTRAUVS0:
-    Additional UV sets created by ueviewer."""
-
-    # ----------------------------------------------------------------------------------------------
-    u: int  # texture U coordinate
-    v: int  # texture V coordinate
-
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class UAnimationAction:
     """chunk_id: ANIMINFO:
     UDK: Binary animation info format."""
@@ -167,39 +232,7 @@ class UAnimationAction:
     start_bone: int  # unused: udk: reserved, unused
     first_raw_frame: int  # unused ActorX: udk: no description
     num_raw_frames: int  # total frames for the track (not keyframes)
-    anim_key_frames: list = field(default_factory=list)  # UAnimationKeyframes for this action
-
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
-class UAnimationKeyframe:
-    """chunk_id: ANIMKEYS:
-    UDK: An animation key. Position and orientation relative to parent."""
-
-    # ----------------------------------------------------------------------------------------------
-    px: float  # vector x
-    py: float  # vector y
-    pz: float  # vector z
-    qx: float  # quaternion x
-    qy: float  # quaternion y
-    qz: float  # quaternion z
-    qw: float  # quaternion w
-    time: float  # unused: udk: duration until next key TODO: determine if this is useful
-    position: Vector = None  # vector position relative to parent
-    orientation: Quaternion = None  # quaternion orientation (rotation) relative to parent
-
-
-# --------------------------------------------------------------------------------------------------
-@dataclass
-class UScaleAnimKey:
-    """chunk_id: SCALEKEYS:
-    UDK:."""
-
-    # ----------------------------------------------------------------------------------------------
-    px: float  #
-    py: float  #
-    pz: float  #
-    time: float  #
+    anim_key_frames: np.ndarray = None  # keyframe_dtype slice for this action
 
 
 # --------------------------------------------------------------------------------------------------
@@ -209,14 +242,18 @@ class ModelData:
     # ----------------------------------------------------------------------------------------------
     def __init__(self, filepath):
         self.filepath = filepath
-        self.points = []
-        self.wedges = []
-        self.faces = []
+        self.points = np.empty((0, 3), dtype=np.float32)
+        self.wedges = np.empty(0, dtype=wedge32_dtype)
+        self.faces = np.empty(0, dtype=face32_dtype)
         self.materials = []
         self.bones = []
-        self.weights = []
+        self.weights = np.empty(0, dtype=weight_dtype)
         self.extrauv = None
         self.extrauvs = []
+        self.wedge_points = None  # internal: (num_wedges,) int32 point index per wedge
+        self.face_wedges = None  # internal: (num_faces, 3) int32 wedge indices in loop order
+        self.bone_quaternions = np.empty((0, 4))  # internal: (num_bones, 4) wxyz per bone
+        self.bone_positions = np.empty((0, 3))  # internal: (num_bones, 3) position per bone
         self.exception_type = None
         self.exception_value = None
         self.exception_traceback = None
@@ -233,167 +270,118 @@ class ModelData:
             self.exception_traceback = exception_traceback
 
     # ----------------------------------------------------------------------------------------------
-    def read_head(self, chunk_id=None, record_count=None, data_file=None):
-        pass
-
-    # ----------------------------------------------------------------------------------------------
-    def read_header(self, data_file):
-        fmt = "<20sLLL"
-        calcsize = struct.calcsize(fmt)
-
-        data_in = data_file.read(calcsize)
-
-        if len(data_in) != 32:
-            return
+    def read_header(self, buffer, offset):
+        if len(buffer) - offset < header_struct.size:
+            return None
 
-        data_in = struct.unpack(fmt, data_in)
-        chunk_header = UChunkHeader(*data_in)
+        chunk_id, _, data_size, data_count = header_struct.unpack_from(buffer, offset)
 
-        chunk_header.chunk_id = bytes.decode(
-            chunk_header.chunk_id.rstrip(b"\x00"), errors="replace"
-        )
-
-        return chunk_header
+        # a bare tuple; the header is thrown away right after dispatch. stop at the
+        # first null instead of scanning the 20-byte id from the back
+        return chunk_id.split(b"\x00", 1)[0].decode("utf-8", "replace"), data_size, data_count
 
     # ----------------------------------------------------------------------------------------------
-    def read_vertices(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<fff"
-        calcsize = struct.calcsize(fmt)
-
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            point = UPoint(record, None, [])
-
-            # if point in self.points:
-            #     print("duplicate point")
+    def read_vertices(self, record_count=None, buffer=None, offset=None):
+        self.points = np.frombuffer(buffer, dtype=point_dtype, count=record_count, offset=offset)
 
-            self.points.append(point)
+        return offset + record_count * point_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
-    def read_wedges(self, chunk_id=None, record_count=None, data_file=None):
-        if record_count <= 65536:
-            fmt = "<HhffBBH"
-        else:
-            fmt = "<LffBBH"
-
-        calcsize = struct.calcsize(fmt)
-
-        if record_count <= 65536:
-            for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-                wedge = UWedge(record[0], *record[2:])
-                wedge.vertex = self.points[wedge.point_index].vertex
-
-                # if wedge in self.wedges:
-                #     print("duplicate wedge")
+    def read_wedges(self, record_count=None, buffer=None, offset=None):
+        record_dtype = wedge16_dtype if record_count <= 65536 else wedge32_dtype
 
-                self.wedges.append(wedge)
-        else:
-            for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-                wedge = UWedge(*record)
-                wedge.vertex = self.points[wedge.point_index].vertex
+        self.wedges = np.frombuffer(buffer, dtype=record_dtype, count=record_count, offset=offset)
 
-                # if wedge in self.wedges:
-                #     print("duplicate wedge")
-
-                self.wedges.append(wedge)
+        return offset + record_count * record_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
-    def read_face16s(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<HHHBBL"
-        calcsize = struct.calcsize(fmt)
-
-        self.read_faces(
-            chunk_id=chunk_id,
-            record_count=record_count,
-            data_file=data_file,
-            fmt=fmt,
-            calcsize=calcsize,
-        )
+    def read_face16s(self, record_count=None, buffer=None, offset=None):
+        self.faces = np.frombuffer(buffer, dtype=face16_dtype, count=record_count, offset=offset)
 
-    # ----------------------------------------------------------------------------------------------
-    def read_face32s(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<LLLBBL"
-        calcsize = struct.calcsize(fmt)
-
-        self.read_faces(
-            chunk_id=chunk_id,
-            record_count=record_count,
-            data_file=data_file,
-            fmt=fmt,
-            calcsize=calcsize,
-        )
+        return offset + record_count * face16_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
-    def read_faces(self, chunk_id=None, record_count=None, data_file=None, fmt=None, calcsize=None):
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            face = UFace(*record)
-
-            # if face in self.faces:
-            #     print("duplicate face")
+    def read_face32s(self, record_count=None, buffer=None, offset=None):
+        self.faces = np.frombuffer(buffer, dtype=face32_dtype, count=record_count, offset=offset)
 
-            self.faces.append(face)
+        return offset + record_count * face32_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
-    def read_materials(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<64sLLLLll"
-        calcsize = struct.calcsize(fmt)
+    def read_materials(self, record_count=None, buffer=None, offset=None):
+        records = np.frombuffer(buffer, dtype=material_dtype, count=record_count, offset=offset)
+
+        # the whole name column is null-stripped and decoded in one vectorized pass;
+        # tolist() hands back native python tuples for the record fields
+        names = np.char.decode(np.char.rstrip(records["name"], b"\x00"), "utf-8").tolist()
 
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            material = UMaterial(*record)
-            material.name = bytes.decode(material.name.rstrip(b"\x00"))
+        for name, record in zip(names, records.tolist()):
+            self.materials.append(UMaterial(name, *record[1:]))
 
-            self.materials.append(material)
+        return offset + record_count * material_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
-    def read_bones(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<64sLllfffffffffff"
-        calcsize = struct.calcsize(fmt)
+    def read_bones(self, record_count=None, buffer=None, offset=None):
+        records = np.frombuffer(buffer, dtype=bone_dtype, count=record_count, offset=offset)
 
-        for index, record in enumerate(
-            struct.iter_unpack(fmt, data_file.read(record_count * calcsize))
-        ):
-            bone = UBone(index, *record)
-            bone.name = bytes.decode(bone.name.rstrip(b"\x00"))
-            bone.position = Vector((bone.px, bone.py, bone.pz))
-            bone.orientation = Quaternion((bone.qw, bone.qx, bone.qy, bone.qz))
+        # wxyz quaternion and position columns for the armature builder's batched
+        # local-matrix math, pulled from the record array instead of per-bone attributes
+        self.bone_quaternions = np.stack(
+            (records["qw"], records["qx"], records["qy"], records["qz"]), axis=-1
+        ).astype(np.float64)
+        self.bone_positions = np.stack(
+            (records["px"], records["py"], records["pz"]), axis=-1
+        ).astype(np.float64)
 
-            self.bones.append(bone)
+        names = np.char.decode(np.char.rstrip(records["name"], b"\x00"), "utf-8").tolist()
 
-    # ----------------------------------------------------------------------------------------------
-    def read_weights(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<fLL"
-        calcsize = struct.calcsize(fmt)
+        for index, (name, record) in enumerate(zip(names, records.tolist())):
+            self.bones.append(UBone(index, name, *record[1:]))
 
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            self.weights.append(UWeight(*record))
+        return offset + record_count * bone_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
-    def read_extra_uv(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<LL"
-        calcsize = struct.calcsize(fmt)
+    def read_weights(self, record_count=None, buffer=None, offset=None):
+        self.weights = np.frombuffer(buffer, dtype=weight_dtype, count=record_count, offset=offset)
 
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            self.extrauvs.append(UExtraUV(*record))
+        return offset + record_count * weight_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
-    def load_data(self, chunk_id=None, record_count=None, data_file=None):
-        loader = dict(
-            ACTRHEAD=dict(reader=self.read_head, records=None),
-            PNTS0000=dict(reader=self.read_vertices, records=self.points),
-            VTXW0000=dict(reader=self.read_wedges, records=self.wedges),
-            FACE0000=dict(reader=self.read_face16s, records=self.faces),
-            FACE3200=dict(reader=self.read_face32s, records=self.faces),
-            MATT0000=dict(reader=self.read_materials, records=self.materials),
-            REFSKELT=dict(reader=self.read_bones, records=self.bones),
-            RAWWEIGHTS=dict(reader=self.read_weights, records=self.weights),
-            EXTRAUVS0=dict(reader=self.read_extra_uv, records=self.extrauv),
-            EXTRAUVS1=dict(reader=self.read_extra_uv, records=self.extrauv),
-            EXTRAUVS2=dict(reader=self.read_extra_uv, records=self.extrauv),
-        ).get(chunk_id)
-
-        if loader:
-            loader["records"] = loader["reader"](
-                chunk_id=chunk_id, record_count=record_count, data_file=data_file
-            )
+    def read_extra_uv(self, record_count=None, buffer=None, offset=None):
+        # one record array per EXTRAUVS chunk
+        self.extrauvs.append(
+            np.frombuffer(buffer, dtype=extra_uv_dtype, count=record_count, offset=offset)
+        )
+
+        return offset + record_count * extra_uv_dtype.itemsize
+
+    # ----------------------------------------------------------------------------------------------
+    def load_data(self, chunk_id=None, data_size=None, data_count=None, buffer=None, offset=None):
+        # a direct if/elif chain over the small fixed id set; string equality on interned
+        # literals short-circuits without the dict hashing. the branches are ordered by
+        # expected record volume
+        if chunk_id == "PNTS0000":
+            return self.read_vertices(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "VTXW0000":
+            return self.read_wedges(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "FACE0000":
+            return self.read_face16s(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "FACE3200":
+            return self.read_face32s(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "RAWWEIGHTS":
+            return self.read_weights(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id in ("EXTRAUVS0", "EXTRAUVS1", "EXTRAUVS2"):
+            return self.read_extra_uv(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "MATT0000":
+            return self.read_materials(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "REFSKELT":
+            return self.read_bones(record_count=data_count, buffer=buffer, offset=offset)
+
+        # the file header chunk carries no records; unknown chunks are skipped by their
+        # declared record size
+        if chunk_id == "ACTRHEAD":
+            return offset
+
+        return offset + data_size * data_count
 
     # ----------------------------------------------------------------------------------------------
     # @SectionHeader()
@@ -408,23 +396,40 @@ class ModelData:
 
     # ----------------------------------------------------------------------------------------------
     # @SectionHeader()
-    def parse_psk_file(self):
-        """parse and load an actorx psk / pskx model file."""
-
-        with open(self.filepath, "rb") as data_file:
-            record_count = None
-
-            while True:
-                chunk_header = self.read_header(data_file)
-
-                if not chunk_header:
-                    break
-
-                chunk_id = chunk_header.chunk_id
+    def parse_psk_file(self, data: bytes = None):
+        """parse and load an actorx psk / pskx model file. a pre-read buffer may be
+        passed in to skip the file read."""
+
+        # one read of the whole file; every chunk is then decoded in place by offset
+        # instead of issuing two buffered reads per chunk
+        if data is None:
+            with open(self.filepath, "rb") as data_file:
+                data = data_file.read()
+
+        buffer = memoryview(data)
+
+        offset = 0
+
+        while header := self.read_header(buffer, offset):
+            chunk_id, data_size, data_count = header
+            offset = self.load_data(
+                chunk_id=chunk_id,
+                data_size=data_size,
+                data_count=data_count,
+                buffer=buffer,
+                offset=offset + header_struct.size,
+            )
 
-                record_count = chunk_header.data_count
+        # flat index tables for the mesh builder: contiguous int32 copies of the record
+        # fields, with the face wedges already in blender's loop order
+        self.wedge_points = self.wedges["point_index"].astype(np.int32)
+        self.face_wedges = np.stack(
+            (self.faces["wedge_1"], self.faces["wedge_0"], self.faces["wedge_2"]), axis=1
+        ).astype(np.int32)
 
-                self.load_data(chunk_id=chunk_id, record_count=record_count, data_file=data_file)
+        # skip the whole dump block with one probe when debugging is off
+        if not any(debug_dump.values()):
+            return
 
         if points := debug_dump["points"] > 0:
             self.dump_data("self.points", self.points, points)
@@ -470,121 +475,118 @@ class AnimData:
             self.exception_traceback = exception_traceback
 
     # ----------------------------------------------------------------------------------------------
-    def read_head(self, chunk_id=None, record_count=None, data_file=None):
-        pass
+    def read_header(self, buffer, offset):
+        if len(buffer) - offset < header_struct.size:
+            return None
 
-    # ----------------------------------------------------------------------------------------------
-    def read_header(self, data_file):
-        fmt = "<20sLLL"
-        calcsize = struct.calcsize(fmt)
-
-        data_in = data_file.read(calcsize)
-
-        if len(data_in) != 32:
-            return
-
-        data_in = struct.unpack(fmt, data_in)
-        chunk_header = UChunkHeader(*data_in)
-
-        chunk_header.chunk_id = bytes.decode(
-            chunk_header.chunk_id.rstrip(b"\x00"), errors="replace"
-        )
+        chunk_id, _, data_size, data_count = header_struct.unpack_from(buffer, offset)
 
-        return chunk_header
+        # a bare tuple; the header is thrown away right after dispatch. stop at the
+        # first null instead of scanning the 20-byte id from the back
+        return chunk_id.split(b"\x00", 1)[0].decode("utf-8", "replace"), data_size, data_count
 
     # ----------------------------------------------------------------------------------------------
-    def read_bones(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<64sLllfffffffffff"
-        calcsize = struct.calcsize(fmt)
+    def read_bones(self, record_count=None, buffer=None, offset=None):
+        records = np.frombuffer(buffer, dtype=bone_dtype, count=record_count, offset=offset)
 
-        for index, record in enumerate(
-            struct.iter_unpack(fmt, data_file.read(record_count * calcsize))
-        ):
-            bone = UBone(index, *record)
-            bone.name = bytes.decode(bone.name.rstrip(b"\x00"))
-            bone.position = Vector((bone.px, bone.py, bone.pz))
-            bone.orientation = Quaternion((bone.qw, bone.qx, bone.qy, bone.qz))
+        names = np.char.decode(np.char.rstrip(records["name"], b"\x00"), "utf-8").tolist()
+
+        for index, (name, record) in enumerate(zip(names, records.tolist())):
+            bone = UBone(index, name, *record[1:])
 
             self.bones.append(bone)
             self.psa_bones[bone.name] = bone
 
+        return offset + record_count * bone_dtype.itemsize
+
     # ----------------------------------------------------------------------------------------------
-    def read_actions(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<64s64sllllffflll"
-        calcsize = struct.calcsize(fmt)
+    def read_actions(self, record_count=None, buffer=None, offset=None):
+        records = np.frombuffer(buffer, dtype=action_dtype, count=record_count, offset=offset)
 
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            anim_action = UAnimationAction(*record)
-            anim_action.name = bytes.decode(anim_action.name.rstrip(b"\x00"))
-            anim_action.group = bytes.decode(anim_action.group.rstrip(b"\x00"))
+        names = np.char.decode(np.char.rstrip(records["name"], b"\x00"), "utf-8").tolist()
+        groups = np.char.decode(np.char.rstrip(records["group"], b"\x00"), "utf-8").tolist()
 
-            self.actions.append([anim_action.name, anim_action])
+        for name, group, record in zip(names, groups, records.tolist()):
+            self.actions.append([name, UAnimationAction(name, group, *record[2:])])
 
-    # ----------------------------------------------------------------------------------------------
-    def read_keyframes(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<ffffffff"
-        calcsize = struct.calcsize(fmt)
+        return offset + record_count * action_dtype.itemsize
 
-        key_frames = []
+    # ----------------------------------------------------------------------------------------------
+    def read_keyframes(self, record_count=None, buffer=None, offset=None):
+        key_frames = np.frombuffer(buffer, dtype=keyframe_dtype, count=record_count, offset=offset)
 
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            keyframe = UAnimationKeyframe(*record)
-            keyframe.position = Vector((keyframe.px, keyframe.py, keyframe.pz))
-            keyframe.orientation = Quaternion((keyframe.qw, keyframe.qx, keyframe.qy, keyframe.qz))
+        self.key_frames = key_frames
 
-            key_frames.append(keyframe)
+        # the keyframes are stored back to back per action; each action gets its slice of
+        # the record array instead of copied per-frame objects, with the partition
+        # offsets computed in one cumsum over the per-action key counts
+        sizes = np.array(
+            [action.total_bones * action.num_raw_frames for _, action in self.actions],
+            dtype=np.int64,
+        )
+        starts = np.concatenate(([0], sizes.cumsum()[:-1]))
 
-        start = 0
-        stop = 0
+        for (action_name, action), start, size in zip(
+            self.actions, starts.tolist(), sizes.tolist()
+        ):
+            action.anim_key_frames = key_frames[start : start + size]
 
-        for action_name, action in self.actions:
-            stop = stop + (action.total_bones * action.num_raw_frames)
-            for frame in islice(key_frames, start, stop):
-                action.anim_key_frames.append(frame)
-            start = start + (action.total_bones * action.num_raw_frames)
+        return offset + record_count * keyframe_dtype.itemsize
 
     # ----------------------------------------------------------------------------------------------
 
-    def read_scalekeys(self, chunk_id=None, record_count=None, data_file=None):
-        fmt = "<ffff"
-        calcsize = struct.calcsize(fmt)
-
-        for record in struct.iter_unpack(fmt, data_file.read(record_count * calcsize)):
-            scalekey = UScaleAnimKey(*record)
+    def read_scalekeys(self, record_count=None, buffer=None, offset=None):
+        self.scale_keys = np.frombuffer(
+            buffer, dtype=scale_key_dtype, count=record_count, offset=offset
+        )
 
-            self.scale_keys.append(scalekey)
+        return offset + record_count * scale_key_dtype.itemsize
 
     def split_anim_keys(self, anim_keys: dict):
         pass
 
     # ----------------------------------------------------------------------------------------------
-    def load_data(self, chunk_id=None, record_count=None, data_file=None):
-        loader = dict(
-            ACTRHEAD=dict(reader=self.read_head),
-            BONENAMES=dict(reader=self.read_bones),
-            ANIMINFO=dict(reader=self.read_actions),
-            ANIMKEYS=dict(reader=self.read_keyframes),
-            SCALEKEYS=dict(reader=self.read_scalekeys),
-        ).get(chunk_id)
-
-        if loader:
-            loader["reader"](chunk_id=chunk_id, record_count=record_count, data_file=data_file)
-
-    # ----------------------------------------------------------------------------------------------
-    def parse_psa_file(self):
-        """parse and load an actorx psa animation file."""
-
-        with open(self.filepath, "rb") as data_file:
-            record_count = None
-
-            while True:
-                chunk_header = self.read_header(data_file)
-
-                if not chunk_header:
-                    break
-
-                chunk_id = chunk_header.chunk_id
-
-                record_count = chunk_header.data_count
-
-                self.load_data(chunk_id=chunk_id, record_count=record_count, data_file=data_file)
+    def load_data(self, chunk_id=None, data_size=None, data_count=None, buffer=None, offset=None):
+        # a direct if/elif chain over the small fixed id set; string equality on interned
+        # literals short-circuits without the dict hashing. the branches are ordered by
+        # expected record volume
+        if chunk_id == "ANIMKEYS":
+            return self.read_keyframes(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "SCALEKEYS":
+            return self.read_scalekeys(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "BONENAMES":
+            return self.read_bones(record_count=data_count, buffer=buffer, offset=offset)
+        if chunk_id == "ANIMINFO":
+            return self.read_actions(record_count=data_count, buffer=buffer, offset=offset)
+
+        # the file header chunks carry no records; unknown chunks are skipped by their
+        # declared record size
+        if chunk_id in ("ANIMHEAD", "ACTRHEAD"):
+            return offset
+
+        return offset + data_size * data_count
+
+    # ----------------------------------------------------------------------------------------------
+    def parse_psa_file(self, data: bytes = None):
+        """parse and load an actorx psa animation file. a pre-read buffer may be passed
+        in to skip the file read."""
+
+        # one read of the whole file; every chunk is then decoded in place by offset
+        # instead of issuing two buffered reads per chunk
+        if data is None:
+            with open(self.filepath, "rb") as data_file:
+                data = data_file.read()
+
+        buffer = memoryview(data)
+
+        offset = 0
+
+        while header := self.read_header(buffer, offset):
+            chunk_id, data_size, data_count = header
+            offset = self.load_data(
+                chunk_id=chunk_id,
+                data_size=data_size,
+                data_count=data_count,
+                buffer=buffer,
+                offset=offset + header_struct.size,
+            )
@@ -15,6 +15,49 @@ from .core.core import hex_to_rgba, set_defaults
 from .operators import ACTORXNODE_OT_AddFile
 from .properties import AxAnimation
 
+# draw-path settings resolved once at registration. the draw handlers fire on every
+# editor redraw so each call reads one module attribute instead of the settings cache
+animation_socket_color = None
+animation_use_property_split = False
+
+
+# --------------------------------------------------------------------------------------------------
+def load_draw_cache():
+    """resolve the user settings touched by the draw handlers into module attributes."""
+
+    global animation_socket_color, animation_use_property_split
+
+    animation_socket_color = hex_to_rgba(
+        config.user_settings["socket_colors"]["animation_socket"]
+    )
+    animation_use_property_split = config.user_settings["animation_node"]["use_property_split"]
+
+
+# the operator id string is a class attribute lookup; resolve it once for the row helper
+add_file_idname = ACTORXNODE_OT_AddFile.bl_idname
+
+
+# --------------------------------------------------------------------------------------------------
+def add_file_select_row(
+    layout: UILayout,
+    node_prop,
+    textbox: str,
+    label: str,
+    source_node: str,
+    target_prop: str,
+) -> None:
+    """adds a row with a textbox and file select button.
+    - source_node: the node to set properties values.
+    - target_prop: the target property to set on the source node."""
+
+    row = layout.row(align=True)
+    row.prop(node_prop, textbox, text=label)
+    op = row.operator(add_file_idname, text="", emboss=True, icon="FILEBROWSER")
+    op.import_what = node_prop.import_what
+    op.filter_glob = node_prop.filter_glob
+    op.source_node = source_node
+    op.target_prop = target_prop
+
 
 # --------------------------------------------------------------------------------------------------
 class ActorXAnimationSocketOut(NodeSocket):
@@ -26,19 +69,23 @@ class ActorXAnimationSocketOut(NodeSocket):
     identifier = "animation_socket"
     link_limit = 1
 
-    node_path: StringProperty(default="", options={"HIDDEN"})
+    node_path: StringProperty(default="", options={"HIDDEN", "SKIP_SAVE"})
 
     # ----------------------------------------------------------------------------------------------
     def draw(self, context: Context, layout: UILayout, node: Node, text: str):
+        # the rna path stringify runs once per socket; draw fires on every editor redraw
+        if not self.node_path:
+            self.node_path = repr(self).split(".", maxsplit=1)[1].rsplit(".", maxsplit=1)[0]
+
         draw_ax_animation_props(
             context=context,
             layout=layout,
             animation_node=node,
-            source_node=repr(self).split(".", maxsplit=1)[1].rsplit(".", maxsplit=1)[0],
+            source_node=self.node_path,
         )
 
     def draw_color(self, context: Context, node: Node) -> dict:
-        return hex_to_rgba(config.user_settings["socket_colors"]["animation_socket"])
+        return animation_socket_color
 
 
 # --------------------------------------------------------------------------------------------------
@@ -79,54 +126,28 @@ def draw_ax_animation_props(
 ) -> None:
     """draws the controls on the node with values from the property driver."""
 
-    # ----------------------------------------------------------------------------------------------
-    def add_file_select_row(
-        layout: UILayout,
-        animation_node_prop: AxAnimation,
-        textbox: str,
-        label: str,
-        source_node: str,
-        target_prop: str,
-    ) -> None:
-        """adds a row with a textbox and file select button.
-        - source_node: the animation node to set properties values.
-        - target_prop: the target property to set on the source node."""
-
-        row = layout.row(align=True)
-        row.prop(animation_node_prop, textbox, text=label)
-        op = row.operator(ACTORXNODE_OT_AddFile.bl_idname, text="", emboss=True, icon="FILEBROWSER")
-        op.import_what = animation_node_prop.import_what
-        op.filter_glob = animation_node_prop.filter_glob
-        op.source_node = source_node
-        op.target_prop = target_prop
-
-    # ----------------------------------------------------------------------------------------------
-    layout.use_property_split = config.user_settings["animation_node"]["use_property_split"]
+    layout.use_property_split = animation_use_property_split
     layout.use_property_decorate = False
     col = layout.column(align=True)
 
-    add_file_select_row(
-        layout=col,
-        animation_node_prop=animation_node.ax_animation_props,
-        textbox="display_name",
-        label="Animation",
-        source_node=source_node,
-        target_prop="ax_animation_props",
-    )
+    props = animation_node.ax_animation_props
 
-    col.prop(animation_node.ax_animation_props, "conjugate_root")
-    col.prop(animation_node.ax_animation_props, "use_translation")
+    add_file_select_row(col, props, "display_name", "Animation", source_node, "ax_animation_props")
 
-    col.use_property_split = False
-    col.prop(animation_node.ax_animation_props, "hide_advanced_options")
+    col.prop(props, "conjugate_root")
+    col.prop(props, "use_translation")
 
-    # if not config.user_settings["animation_node"]["hide_advanced_options"]:
-    if not animation_node.ax_animation_props.hide_advanced_options:
-        col.use_property_split = config.user_settings["animation_node"]["use_property_split"]
+    # the flat toggle gets its own sub-column so the main column's split flag is written
+    # once by the layout instead of being flipped around the toggle
+    flat = col.column(align=True)
+    flat.use_property_split = False
+    flat.prop(props, "hide_advanced_options")
 
-        col.prop(animation_node.ax_animation_props, "conjugate_non_root")
-        col.prop(animation_node.ax_animation_props, "to_axis_forward")
-        col.prop(animation_node.ax_animation_props, "to_axis_up")
+    # if not config.user_settings["animation_node"]["hide_advanced_options"]:
+    if not props.hide_advanced_options:
+        col.prop(props, "conjugate_non_root")
+        col.prop(props, "to_axis_forward")
+        col.prop(props, "to_axis_up")
 
 
 # --------------------------------------------------------------------------------------------------
@@ -136,17 +157,20 @@ classes = [
 ]
 
 
+# --------------------------------------------------------------------------------------------------
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 # --------------------------------------------------------------------------------------------------
 def register():
     """register blender classes."""
 
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    load_draw_cache()
+    register_classes()
 
 
 # --------------------------------------------------------------------------------------------------
 def unregister():
     """unregister blender classes."""
 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
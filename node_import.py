@@ -13,8 +13,7 @@ from bpy.types import Context, Node, NodeLink, UILayout
 from .core.core import Configuration as config
 from .core.core import hex_to_rgba
 from .operators import (
-    ACTORXNODE_OT_AddMeshInputSocket,
-    ACTORXNODE_OT_AddModelInputSocket,
+    ACTORXNODE_OT_AddInputSocket,
     ACTORXNODE_OT_RunImport,
 )
 
@@ -47,7 +46,6 @@ class ActorXImportNode(Node):
     def draw_buttons(self, context: Context, layout: UILayout):
         layout.use_property_split = False
         layout.use_property_decorate = False
-        col = layout.column(align=False)
 
         node_ax_import = context.scene.node_ax_import
 
@@ -55,18 +53,18 @@ class ActorXImportNode(Node):
         row.prop(node_ax_import, "blender_collection", text="Collection")
         row = layout.row(align=True)
         row.prop(node_ax_import, "import_status", text="Status")
+
+        # one column holds all the operators; draw_buttons runs on every editor redraw so
+        # the discarded leading column and the second operator column are not allocated.
+        # the node goes into the layout context so the operators read source_repr from it
+        # instead of paying an rna write per button per redraw
+        layout.context_pointer_set("node", self)
         col = layout.column(align=False)
-        add_model_socket = col.operator(
-            ACTORXNODE_OT_AddModelInputSocket.bl_idname, text="Model", icon="ADD"
-        )
-        add_model_socket.source_repr = self.source_repr
-        add_mesh_socket = col.operator(
-            ACTORXNODE_OT_AddMeshInputSocket.bl_idname, text="Mesh", icon="ADD"
-        )
-        add_mesh_socket.source_repr = self.source_repr
-        col = layout.column(align=False)
-        action = col.operator(ACTORXNODE_OT_RunImport.bl_idname, text="Run Import")
-        action.source_repr = self.source_repr
+        op = col.operator(ACTORXNODE_OT_AddInputSocket.bl_idname, text="Model", icon="ADD")
+        op.kind = "model"
+        op = col.operator(ACTORXNODE_OT_AddInputSocket.bl_idname, text="Mesh", icon="ADD")
+        op.kind = "mesh"
+        col.operator(ACTORXNODE_OT_RunImport.bl_idname, text="Run Import")
 
     # ----------------------------------------------------------------------------------------------
     def insert_link(self, link: NodeLink):
@@ -83,12 +81,5 @@ classes = [
 
 
 # --------------------------------------------------------------------------------------------------
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-# --------------------------------------------------------------------------------------------------
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+# the factory registration batches the rna registration of the class list
+register, unregister = bpy.utils.register_classes_factory(classes)
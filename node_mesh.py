@@ -18,6 +18,54 @@ from .core.core import hex_to_rgba, set_defaults
 from .operators import ACTORXNODE_OT_AddFile, ACTORXNODE_OT_AddFolder
 from .properties import AxMesh
 
+# draw-path settings resolved once at registration. the draw handlers fire on every
+# editor redraw so each call reads one module attribute instead of the settings cache
+mesh_socket_color = None
+mesh_use_property_split = False
+
+
+# --------------------------------------------------------------------------------------------------
+def load_draw_cache():
+    """resolve the user settings touched by the draw handlers into module attributes."""
+
+    global mesh_socket_color, mesh_use_property_split
+
+    mesh_socket_color = hex_to_rgba(config.user_settings["socket_colors"]["mesh_socket"])
+    mesh_use_property_split = config.user_settings["mesh_node"]["use_property_split"]
+
+
+# the operator id strings are class attribute lookups; resolve them once for the row helper
+add_file_idname = ACTORXNODE_OT_AddFile.bl_idname
+add_folder_idname = ACTORXNODE_OT_AddFolder.bl_idname
+
+
+# --------------------------------------------------------------------------------------------------
+def add_file_select_row(
+    layout: UILayout,
+    node_prop,
+    textbox: str,
+    label: str,
+    source_node: str,
+    target_prop: str,
+    add_folder: bool = False,
+) -> None:
+    """adds a row with a textbox and file select button.
+    - source_node: the node to set properties values.
+    - target_prop: the target property to set on the source node."""
+
+    row = layout.row(align=True)
+    row.prop(node_prop, textbox, text=label)
+    op = row.operator(
+        add_folder_idname if add_folder else add_file_idname,
+        text="",
+        emboss=True,
+        icon="FILEBROWSER",
+    )
+    op.import_what = node_prop.import_what
+    op.filter_glob = node_prop.filter_glob
+    op.source_node = source_node
+    op.target_prop = target_prop
+
 
 # --------------------------------------------------------------------------------------------------
 class ActorXMeshSocketOut(NodeSocket):
@@ -29,19 +77,23 @@ class ActorXMeshSocketOut(NodeSocket):
     identifier = "mesh_socket"
     link_limit = 1
 
-    node_path: StringProperty(default="", options={"HIDDEN"})
+    node_path: StringProperty(default="", options={"HIDDEN", "SKIP_SAVE"})
 
     # ----------------------------------------------------------------------------------------------
     def draw(self, context: Context, layout: UILayout, node: Node, text: str):
+        # the rna path stringify runs once per socket; draw fires on every editor redraw
+        if not self.node_path:
+            self.node_path = repr(self).split(".", maxsplit=1)[1].rsplit(".", maxsplit=1)[0]
+
         draw_ax_mesh_props(
             context=context,
             layout=layout,
             mesh_node=node,
-            source_node=repr(self).split(".", maxsplit=1)[1].rsplit(".", maxsplit=1)[0],
+            source_node=self.node_path,
         )
 
     def draw_color(self, context: Context, node: Node) -> dict:
-        return hex_to_rgba(config.user_settings["socket_colors"]["mesh_socket"])
+        return mesh_socket_color
 
 
 # --------------------------------------------------------------------------------------------------
@@ -88,114 +140,76 @@ def draw_ax_mesh_props(
 ) -> None:
     """draws the controls on the node with values from the property driver."""
 
-    # ----------------------------------------------------------------------------------------------
-    def add_file_select_row(
-        layout: UILayout,
-        mesh_node_prop: AxMesh,
-        textbox: str,
-        label: str,
-        source_node: str,
-        target_prop: str,
-        add_folder: bool = False,
-    ) -> None:
-        """adds a row with a textbox and file select button.
-        - source_node: the mesh node to set properties values.
-        - target_prop: the target property to set on the source node."""
-
-        row = layout.row(align=True)
-        row.prop(mesh_node_prop, textbox, text=label)
-        if not add_folder:
-            op = row.operator(
-                ACTORXNODE_OT_AddFile.bl_idname, text="", emboss=True, icon="FILEBROWSER"
-            )
-        else:
-            op = row.operator(
-                ACTORXNODE_OT_AddFolder.bl_idname, text="", emboss=True, icon="FILEBROWSER"
-            )
-        op.import_what = mesh_node_prop.import_what
-        op.filter_glob = mesh_node_prop.filter_glob
-        op.source_node = source_node
-        op.target_prop = target_prop
-
-    # ----------------------------------------------------------------------------------------------
-    layout.use_property_split = config.user_settings["mesh_node"]["use_property_split"]
+    layout.use_property_split = mesh_use_property_split
     layout.use_property_decorate = False
     col = layout.column(align=True)
 
-    add_file_select_row(
-        layout=col,
-        mesh_node_prop=mesh_node.ax_mesh_props,
-        textbox="display_name",
-        label="Mesh",
-        source_node=source_node,
-        target_prop="ax_mesh_props",
-    )
+    props = mesh_node.ax_mesh_props
 
+    add_file_select_row(col, props, "display_name", "Mesh", source_node, "ax_mesh_props")
     add_file_select_row(
-        layout=col,
-        mesh_node_prop=mesh_node.ax_mesh_props.ueviewer_mat,
-        textbox="display_name",
-        label="Material",
-        source_node=source_node,
-        target_prop="ax_mesh_props.ueviewer_mat",
+        col,
+        props.ueviewer_mat,
+        "display_name",
+        "Material",
+        source_node,
+        "ax_mesh_props.ueviewer_mat",
     )
-
     add_file_select_row(
-        layout=col,
-        mesh_node_prop=mesh_node.ax_mesh_props.texture_path,
-        textbox="display_name",
-        label="Texture Path",
-        source_node=source_node,
-        target_prop="ax_mesh_props.texture_path",
-        add_folder=True,
+        col,
+        props.texture_path,
+        "display_name",
+        "Texture Path",
+        source_node,
+        "ax_mesh_props.texture_path",
+        True,
     )
 
-    col.prop(mesh_node.ax_mesh_props, "remove_doubles")
-    col.prop(mesh_node.ax_mesh_props, "smooth_shading")
-    col.prop(mesh_node.ax_mesh_props, "invert_green_channel")
+    col.prop(props, "remove_doubles")
+    col.prop(props, "smooth_shading")
+    col.prop(props, "invert_green_channel")
 
-    col.use_property_split = False
-    col.prop(mesh_node.ax_mesh_props, "hide_texture_maps")
+    # the flat toggles get their own sub-columns so the main column's split flag is
+    # written once by the layout instead of being flipped around every toggle
+    flat = col.column(align=True)
+    flat.use_property_split = False
+    flat.prop(props, "hide_texture_maps")
 
     # if not config.user_settings["mesh_node"]["hide_texture_maps"]:
-    if not mesh_node.ax_mesh_props.hide_texture_maps:
-        col.use_property_split = config.user_settings["mesh_node"]["use_property_split"]
-
+    if not props.hide_texture_maps:
         add_file_select_row(
-            layout=col,
-            mesh_node_prop=mesh_node.ax_mesh_props.diffuse_map,
-            textbox="display_name",
-            label="Diffuse",
-            source_node=source_node,
-            target_prop="ax_mesh_props.diffuse_map",
+            col,
+            props.diffuse_map,
+            "display_name",
+            "Diffuse",
+            source_node,
+            "ax_mesh_props.diffuse_map",
         )
-
         add_file_select_row(
-            layout=col,
-            mesh_node_prop=mesh_node.ax_mesh_props.specular_map,
-            textbox="display_name",
-            label="Specular",
-            source_node=source_node,
-            target_prop="ax_mesh_props.specular_map",
+            col,
+            props.specular_map,
+            "display_name",
+            "Specular",
+            source_node,
+            "ax_mesh_props.specular_map",
         )
-
         add_file_select_row(
-            layout=col,
-            mesh_node_prop=mesh_node.ax_mesh_props.normal_map,
-            textbox="display_name",
-            label="Normal",
-            source_node=source_node,
-            target_prop="ax_mesh_props.normal_map",
+            col,
+            props.normal_map,
+            "display_name",
+            "Normal",
+            source_node,
+            "ax_mesh_props.normal_map",
         )
 
-    col.use_property_split = False
-    col.prop(mesh_node.ax_mesh_props, "hide_advanced_options")
+    flat = col.column(align=True)
+    flat.use_property_split = False
+    flat.prop(props, "hide_advanced_options")
 
     # if not config.user_settings["mesh_node"]["hide_advanced_options"]:
-    if not mesh_node.ax_mesh_props.hide_advanced_options:
-        col.use_property_split = config.user_settings["mesh_node"]["use_property_split"]
-        col.prop(mesh_node.ax_mesh_props, "from_axis_forward")
-        col.prop(mesh_node.ax_mesh_props, "from_axis_up")
+    if not props.hide_advanced_options:
+        col.prop(props, "from_axis_forward")
+        col.prop(props, "from_axis_up")
 
 
 # --------------------------------------------------------------------------------------------------
@@ -205,17 +219,20 @@ classes = [
 ]
 
 
+# --------------------------------------------------------------------------------------------------
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 # --------------------------------------------------------------------------------------------------
 def register():
     """register blender classes."""
 
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    load_draw_cache()
+    register_classes()
 
 
 # --------------------------------------------------------------------------------------------------
 def unregister():
     """unregister blender classes."""
 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
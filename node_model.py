@@ -16,12 +16,62 @@ from .core.core import hex_to_rgba, set_defaults
 # from .core.core import node_colors
 # from .core.core import node_colors, set_defaults
 from .operators import (
-    ACTORXNODE_OT_AddAnimationInputSocket,
     ACTORXNODE_OT_AddFile,
     ACTORXNODE_OT_AddFolder,
+    ACTORXNODE_OT_AddInputSocket,
 )
 from .properties import AxModel
 
+# draw-path settings resolved once at registration. the draw handlers fire on every
+# editor redraw so each call reads one module attribute instead of the settings cache
+model_socket_color = None
+model_use_property_split = False
+model_hide_linking = False
+
+
+# --------------------------------------------------------------------------------------------------
+def load_draw_cache():
+    """resolve the user settings touched by the draw handlers into module attributes."""
+
+    global model_socket_color, model_use_property_split, model_hide_linking
+
+    model_socket_color = hex_to_rgba(config.user_settings["socket_colors"]["model_socket"])
+    model_use_property_split = config.user_settings["model_node"]["use_property_split"]
+    model_hide_linking = config.user_settings["model_node"]["hide_model_linking"]
+
+
+# the operator id strings are class attribute lookups; resolve them once for the row helper
+add_file_idname = ACTORXNODE_OT_AddFile.bl_idname
+add_folder_idname = ACTORXNODE_OT_AddFolder.bl_idname
+
+
+# --------------------------------------------------------------------------------------------------
+def add_file_select_row(
+    layout: UILayout,
+    node_prop,
+    textbox: str,
+    label: str,
+    source_node: str,
+    target_prop: str,
+    add_folder: bool = False,
+) -> None:
+    """adds a row with a textbox and file select button.
+    - source_node: the node to set properties values.
+    - target_prop: the target property to set on the source node."""
+
+    row = layout.row(align=True)
+    row.prop(node_prop, textbox, text=label)
+    op = row.operator(
+        add_folder_idname if add_folder else add_file_idname,
+        text="",
+        emboss=True,
+        icon="FILEBROWSER",
+    )
+    op.import_what = node_prop.import_what
+    op.filter_glob = node_prop.filter_glob
+    op.source_node = source_node
+    op.target_prop = target_prop
+
 
 # --------------------------------------------------------------------------------------------------
 class ActorXModelSocketOut(NodeSocket):
@@ -33,19 +83,23 @@ class ActorXModelSocketOut(NodeSocket):
     identifier = "model_socket"
     link_limit = 1
 
-    node_path: StringProperty(default="", options={"HIDDEN"})
+    node_path: StringProperty(default="", options={"HIDDEN", "SKIP_SAVE"})
 
     # ----------------------------------------------------------------------------------------------
     def draw(self, context: Context, layout: UILayout, node: Node, text: str):
+        # the rna path stringify runs once per socket; draw fires on every editor redraw
+        if not self.node_path:
+            self.node_path = repr(self).split(".", maxsplit=1)[1].rsplit(".", maxsplit=1)[0]
+
         draw_ax_model_props(
             context=context,
             layout=layout,
             model_node=node,
-            source_node=repr(self).split(".", maxsplit=1)[1].rsplit(".", maxsplit=1)[0],
+            source_node=self.node_path,
         )
 
     def draw_color(self, context: Context, node: Node) -> dict:
-        return hex_to_rgba(config.user_settings["socket_colors"]["model_socket"])
+        return model_socket_color
         # return node_colors["model_socket"]
 
 
@@ -67,11 +121,13 @@ class ActorXModelNode(Node):
     def draw_buttons(self, context: Context, layout: UILayout):
         layout.use_property_split = False
         layout.use_property_decorate = False
+
+        # the node goes into the layout context so the operator reads source_repr from it
+        # instead of paying an rna write per redraw
+        layout.context_pointer_set("node", self)
         col = layout.column(align=False)
-        add_animation_socket = col.operator(
-            ACTORXNODE_OT_AddAnimationInputSocket.bl_idname, text="Animation", icon="ADD"
-        )
-        add_animation_socket.source_repr = self.source_repr
+        op = col.operator(ACTORXNODE_OT_AddInputSocket.bl_idname, text="Animation", icon="ADD")
+        op.kind = "animation"
 
     # ----------------------------------------------------------------------------------------------
     def init(self, context: Context):
@@ -115,124 +171,84 @@ def draw_ax_model_props(
 ) -> None:
     """draws the controls on the node with values from the property driver."""
 
-    # ----------------------------------------------------------------------------------------------
-    def add_file_select_row(
-        layout: UILayout,
-        model_node_prop: AxModel,
-        textbox: str,
-        label: str,
-        source_node: str,
-        target_prop: str,
-        add_folder: bool = False,
-    ) -> None:
-        """adds a row with a textbox and file select button.
-        - source_node: the model node to set properties values.
-        - target_prop: the target property to set on the source node."""
-
-        row = layout.row(align=True)
-        row.prop(model_node_prop, textbox, text=label)
-        if not add_folder:
-            op = row.operator(
-                ACTORXNODE_OT_AddFile.bl_idname, text="", emboss=True, icon="FILEBROWSER"
-            )
-        else:
-            op = row.operator(
-                ACTORXNODE_OT_AddFolder.bl_idname, text="", emboss=True, icon="FILEBROWSER"
-            )
-        op.import_what = model_node_prop.import_what
-        op.filter_glob = model_node_prop.filter_glob
-        op.source_node = source_node
-        op.target_prop = target_prop
-
-    # ----------------------------------------------------------------------------------------------
-    layout.use_property_split = config.user_settings["model_node"]["use_property_split"]
+    layout.use_property_split = model_use_property_split
     layout.use_property_decorate = False
     col = layout.column(align=True)
 
-    add_file_select_row(
-        layout=col,
-        model_node_prop=model_node.ax_model_props,
-        textbox="display_name",
-        label="Model",
-        source_node=source_node,
-        target_prop="ax_model_props",
-    )
+    props = model_node.ax_model_props
 
+    add_file_select_row(col, props, "display_name", "Model", source_node, "ax_model_props")
     add_file_select_row(
-        layout=col,
-        model_node_prop=model_node.ax_model_props.ueviewer_mat,
-        textbox="display_name",
-        label="Material",
-        source_node=source_node,
-        target_prop="ax_model_props.ueviewer_mat",
+        col,
+        props.ueviewer_mat,
+        "display_name",
+        "Material",
+        source_node,
+        "ax_model_props.ueviewer_mat",
     )
-
     add_file_select_row(
-        layout=col,
-        model_node_prop=model_node.ax_model_props.texture_path,
-        textbox="display_name",
-        label="Texture Path",
-        source_node=source_node,
-        target_prop="ax_model_props.texture_path",
-        add_folder=True,
+        col,
+        props.texture_path,
+        "display_name",
+        "Texture Path",
+        source_node,
+        "ax_model_props.texture_path",
+        True,
     )
 
-    col.prop(model_node.ax_model_props, "remove_doubles")
-    col.prop(model_node.ax_model_props, "smooth_shading")
-    col.prop(model_node.ax_model_props, "invert_green_channel")
-    col.prop(model_node.ax_model_props, "conjugate_root")
-    col.prop(model_node.ax_model_props, "detect_reversed_bones")
-    col.prop(model_node.ax_model_props, "show_bones_as_joints")
+    col.prop(props, "remove_doubles")
+    col.prop(props, "smooth_shading")
+    col.prop(props, "invert_green_channel")
+    col.prop(props, "conjugate_root")
+    col.prop(props, "detect_reversed_bones")
+    col.prop(props, "show_bones_as_joints")
 
-    if not config.user_settings["model_node"]["hide_model_linking"]:
-        col.prop(model_node.ax_model_props, "parent_link")
+    if not model_hide_linking:
+        col.prop(props, "parent_link")
 
-    col.use_property_split = False
-    col.prop(model_node.ax_model_props, "hide_texture_maps")
+    # the flat toggles get their own sub-columns so the main column's split flag is
+    # written once by the layout instead of being flipped around every toggle
+    flat = col.column(align=True)
+    flat.use_property_split = False
+    flat.prop(props, "hide_texture_maps")
 
     # if not config.user_settings["model_node"]["hide_texture_maps"]:
-    if not model_node.ax_model_props.hide_texture_maps:
-        col.use_property_split = config.user_settings["model_node"]["use_property_split"]
-
+    if not props.hide_texture_maps:
         add_file_select_row(
-            layout=col,
-            model_node_prop=model_node.ax_model_props.diffuse_map,
-            textbox="display_name",
-            label="Diffuse",
-            source_node=source_node,
-            target_prop="ax_model_props.diffuse_map",
+            col,
+            props.diffuse_map,
+            "display_name",
+            "Diffuse",
+            source_node,
+            "ax_model_props.diffuse_map",
         )
-
         add_file_select_row(
-            layout=col,
-            model_node_prop=model_node.ax_model_props.specular_map,
-            textbox="display_name",
-            label="Specular",
-            source_node=source_node,
-            target_prop="ax_model_props.specular_map",
+            col,
+            props.specular_map,
+            "display_name",
+            "Specular",
+            source_node,
+            "ax_model_props.specular_map",
         )
-
         add_file_select_row(
-            layout=col,
-            model_node_prop=model_node.ax_model_props.normal_map,
-            textbox="display_name",
-            label="Normal",
-            source_node=source_node,
-            target_prop="ax_model_props.normal_map",
+            col,
+            props.normal_map,
+            "display_name",
+            "Normal",
+            source_node,
+            "ax_model_props.normal_map",
         )
 
-    col.use_property_split = False
-    col.prop(model_node.ax_model_props, "hide_advanced_options")
+    flat = col.column(align=True)
+    flat.use_property_split = False
+    flat.prop(props, "hide_advanced_options")
 
     # if not config.user_settings["model_node"]["hide_advanced_options"]:
-    if not model_node.ax_model_props.hide_advanced_options:
-        col.use_property_split = config.user_settings["model_node"]["use_property_split"]
-
-        col.prop(model_node.ax_model_props, "builder")
-        col.prop(model_node.ax_model_props, "conjugate_non_root")
-        col.prop(model_node.ax_model_props, "from_axis_forward")
-        col.prop(model_node.ax_model_props, "from_axis_up")
-
+    if not props.hide_advanced_options:
+        col.prop(props, "builder")
+        col.prop(props, "conjugate_non_root")
+        col.prop(props, "from_axis_forward")
+        col.prop(props, "from_axis_up")
 
 # --------------------------------------------------------------------------------------------------
 classes = [
@@ -241,17 +257,20 @@ classes = [
 ]
 
 
+# --------------------------------------------------------------------------------------------------
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 # --------------------------------------------------------------------------------------------------
 def register():
     """register blender classes."""
 
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    load_draw_cache()
+    register_classes()
 
 
 # --------------------------------------------------------------------------------------------------
 def unregister():
     """unregister blender classes."""
 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
@@ -18,6 +18,25 @@ from .core.core import hex_to_rgba
 
 # echo = Echo()
 
+# socket draw colors resolved once at registration. draw_color fires continuously while
+# the node editor repaints, so each call returns a precomputed tuple instead of reading
+# the settings cache and re-parsing the hex color
+model_socket_color = None
+mesh_socket_color = None
+animation_socket_color = None
+
+
+# --------------------------------------------------------------------------------------------------
+def load_draw_cache():
+    """resolve the user settings touched by the draw handlers into module attributes."""
+
+    global model_socket_color, mesh_socket_color, animation_socket_color
+
+    socket_colors = config.user_settings["socket_colors"]
+    model_socket_color = hex_to_rgba(socket_colors["model_socket"])
+    mesh_socket_color = hex_to_rgba(socket_colors["mesh_socket"])
+    animation_socket_color = hex_to_rgba(socket_colors["animation_socket"])
+
 
 # --------------------------------------------------------------------------------------------------
 class ActorXModelSocketIn(NodeSocket):
@@ -27,14 +46,16 @@ class ActorXModelSocketIn(NodeSocket):
     identifier = "model_socket"
     link_limit = 1
 
-    source_repr: StringProperty()
-    index: IntProperty()
+    # transient values regenerated at init / link time; SKIP_SAVE keeps them out of the
+    # saved file and the undo copies
+    source_repr: StringProperty(default="", options={"HIDDEN", "SKIP_SAVE"})
+    index: IntProperty(default=0, options={"HIDDEN", "SKIP_SAVE"})
 
     def draw(self, context: Context, layout: UILayout, node: Node, text: str):
         layout.label(text="Model")
 
     def draw_color(self, context: Context, node: Node) -> dict:
-        return hex_to_rgba(config.user_settings["socket_colors"]["model_socket"])
+        return model_socket_color
         # return node_colors["model_socket"]
 
 
@@ -46,15 +67,17 @@ class ActorXMeshSocketIn(NodeSocket):
     identifier = "mesh_socket"
     link_limit = 1
 
-    source_repr: StringProperty()
-    index: IntProperty()
+    # transient values regenerated at init / link time; SKIP_SAVE keeps them out of the
+    # saved file and the undo copies
+    source_repr: StringProperty(default="", options={"HIDDEN", "SKIP_SAVE"})
+    index: IntProperty(default=0, options={"HIDDEN", "SKIP_SAVE"})
 
     # ----------------------------------------------------------------------------------------------
     def draw(self, context: Context, layout: UILayout, node: Node, text: str):
         layout.label(text="Mesh")
 
     def draw_color(self, context: Context, node: Node) -> dict:
-        return hex_to_rgba(config.user_settings["socket_colors"]["mesh_socket"])
+        return mesh_socket_color
         # return node_colors["mesh_socket"]
 
 
@@ -66,15 +89,17 @@ class ActorXAnimationSocketIn(NodeSocket):
     identifier = "animation_socket"
     link_limit = 1
 
-    source_repr: StringProperty()
-    index: IntProperty()
+    # transient values regenerated at init / link time; SKIP_SAVE keeps them out of the
+    # saved file and the undo copies
+    source_repr: StringProperty(default="", options={"HIDDEN", "SKIP_SAVE"})
+    index: IntProperty(default=0, options={"HIDDEN", "SKIP_SAVE"})
 
     # ----------------------------------------------------------------------------------------------
     def draw(self, context: Context, layout: UILayout, node: Node, text: str):
         layout.label(text="Animation")
 
     def draw_color(self, context: Context, node: Node) -> dict:
-        return hex_to_rgba(config.user_settings["socket_colors"]["animation_socket"])
+        return animation_socket_color
         # return node_colors["animation_socket"]
 
 
@@ -86,17 +111,20 @@ classes = [
 ]
 
 
+# --------------------------------------------------------------------------------------------------
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 # --------------------------------------------------------------------------------------------------
 def register():
-    """register the classes and add the scene properties."""
+    """register blender classes."""
 
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    load_draw_cache()
+    register_classes()
 
 
 # --------------------------------------------------------------------------------------------------
 def unregister():
-    """unregister the classes and remove the scene properties."""
+    """unregister blender classes."""
 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
@@ -6,6 +6,8 @@
 
 "custom node tree."
 
+from collections import deque
+
 import bpy
 from bpy.types import NodeTree
 from nodeitems_utils import (
@@ -15,6 +17,30 @@ from nodeitems_utils import (
     unregister_node_categories,
 )
 
+# pending link inserts per tree, keyed by the underlying data pointer as the python
+# wrappers are transient and cannot hold mutables. the old class-level list was shared
+# between every tree
+_inserted_links: dict[int, deque] = {}
+
+# the legal links connect sockets of the same kind; one hash probe on the kind pair
+# replaces the per-link prefix comparison
+_valid_link_pairs = frozenset(
+    (kind, kind) for kind in ("model_socket", "mesh_socket", "animation_socket")
+)
+
+# kind per socket identifier, memoized on the full identifier so numbered duplicates
+# ("<kind>_socket_001") cost one dict probe instead of a split once seen
+_socket_kinds: dict[str, str] = {}
+
+
+# --------------------------------------------------------------------------------------------------
+def _socket_kind(identifier: str) -> str:
+    if (kind := _socket_kinds.get(identifier)) is None:
+        parts = identifier.split("_", 2)
+        kind = _socket_kinds[identifier] = "_".join(parts[:2])
+
+    return kind
+
 
 # --------------------------------------------------------------------------------------------------
 class ActorXImportNodeTree(NodeTree):
@@ -22,23 +48,26 @@ class ActorXImportNodeTree(NodeTree):
     bl_label = "ActorX Import Node Tree"
     bl_icon = "NODETREE"
 
-    inserted_links = []
+    # ----------------------------------------------------------------------------------------------
+    @property
+    def inserted_links(self) -> deque:
+        return _inserted_links.setdefault(self.as_pointer(), deque())
 
     # ----------------------------------------------------------------------------------------------
     def update(self):
         """called when node graph changes."""
-        if len(self.inserted_links) > 0:
-            link = self.inserted_links[0]
 
-            from_socket = link.from_socket.identifier.rsplit("_")
-            to_socket = link.to_socket.identifier.rsplit("_")
-            from_socket = f"{from_socket[0]}_{from_socket[1]}"
-            to_socket = f"{to_socket[0]}_{to_socket[1]}"
+        # drain the queue with popleft so links inserted while this update runs are kept
+        # for the next pass instead of being cleared unprocessed
+        if links := _inserted_links.get(self.as_pointer()):
+            while links:
+                link = links.popleft()
 
-            if from_socket != to_socket:
-                self.links.remove(link)
+                from_kind = _socket_kind(link.from_socket.identifier)
+                to_kind = _socket_kind(link.to_socket.identifier)
 
-        self.inserted_links.clear()
+                if (from_kind, to_kind) not in _valid_link_pairs:
+                    self.links.remove(link)
 
 
 # --------------------------------------------------------------------------------------------------
@@ -79,20 +108,20 @@ classes = [ActorXImportNodeTree]
 
 
 # --------------------------------------------------------------------------------------------------
-def register():
-    """register the classes and add the scene properties."""
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
 
-    for cls in classes:
-        bpy.utils.register_class(cls)
 
+# --------------------------------------------------------------------------------------------------
+def register():
+    """register the classes and add the node categories."""
+
+    register_classes()
     register_node_categories("ACTORX_NODES", node_categories)
 
 
 # --------------------------------------------------------------------------------------------------
 def unregister():
-    """unregister the classes and remove the scene properties."""
+    """unregister the classes and remove the node categories."""
 
     unregister_node_categories("ACTORX_NODES")
-
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
@@ -6,17 +6,50 @@
 
 """root import node and panel drawing."""
 
-from pathlib import Path
-
 import bpy
 from bpy.props import IntProperty, StringProperty
 from bpy.types import Context, Operator
 from bpy_extras.io_utils import ImportHelper
+# set is aliased so the builtin is not shadowed at module scope
 from magicattr import get
+from magicattr import set as attr_set
 
 from .core.core import MatFileReadError, MissingImportFileName
 from .processor import walk_import_nodes
 
+# resolved magicattr targets keyed by dotted path. the node paths repeat across operator
+# invocations, so the parse and attribute walk are only paid on the first hit. the cache
+# is cleared on depsgraph updates as node renames invalidate the paths
+_attr_cache: dict[str, object] = {}
+
+
+# --------------------------------------------------------------------------------------------------
+def _resolve_target(path: str):
+    if (target := _attr_cache.get(path)) is None:
+        target = _attr_cache[path] = get(bpy, path)
+
+    return target
+
+
+# --------------------------------------------------------------------------------------------------
+def _clear_attr_cache(scene, depsgraph):
+    _attr_cache.clear()
+
+
+# --------------------------------------------------------------------------------------------------
+def _resolve_source_repr(operator, context) -> str:
+    """the node draw handlers expose their node through the layout context instead of
+    writing source_repr onto every button; the explicit property still wins so scripted
+    calls keep working."""
+
+    if operator.source_repr:
+        return operator.source_repr
+
+    if node := getattr(context, "node", None):
+        return node.source_repr
+
+    return ""
+
 
 # --------------------------------------------------------------------------------------------------
 class ACTORXNODE_OT_AddFolder(Operator, ImportHelper):
@@ -44,15 +77,30 @@ class ACTORXNODE_OT_AddFolder(Operator, ImportHelper):
 
     # ----------------------------------------------------------------------------------------------
     def execute(self, context):
-        from magicattr import get, set
+        # a separator replace is all the posix conversion needs; building a Path only to
+        # stringify it again parses the whole path
+        directory = self.directory.replace("\\", "/")
 
-        target = get(bpy, f"{self.source_node}.{self.target_prop}")
-        set(target, "file_path", Path(self.directory).as_posix())
-        set(target, "display_name", Path(self.directory).as_posix())
+        target = _resolve_target(f"{self.source_node}.{self.target_prop}")
+        attr_set(target, "file_path", directory)
+        attr_set(target, "display_name", directory)
 
         return {"FINISHED"}
 
 
+# file-select dialog title per import_what value. a dict probe replaces the old match
+# statement, whose texture case was a tuple pattern that could never match a string
+_file_labels = {
+    "Model": "Add Model",
+    "Mesh": "Add Mesh",
+    "Animation": "Add Animation",
+    "Material": "Add UEV Material",
+    "DiffuseMap": "Add Texture",
+    "SpecularMap": "Add Texture",
+    "NormalMap": "Add Texture",
+}
+
+
 # --------------------------------------------------------------------------------------------------
 class ACTORXNODE_OT_AddFile(Operator, ImportHelper):
     """add a ueviewer material or texture map.
@@ -73,17 +121,7 @@ class ACTORXNODE_OT_AddFile(Operator, ImportHelper):
     # ----------------------------------------------------------------------------------------------
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        match self.import_what:
-            case "Model":
-                self.bl_label = "Add Model"
-            case "Mesh":
-                self.bl_label = "Add Mesh"
-            case "Animation":
-                self.bl_label = "Add Animation"
-            case "Material":
-                self.bl_label = "Add UEV Material"
-            case "DiffuseMap", "SpecularMap", "NormalMap":
-                self.bl_label = "Add Texture"
+        self.bl_label = _file_labels.get(self.import_what, "")
 
     # ----------------------------------------------------------------------------------------------
     def invoke(self, context, event):
@@ -91,72 +129,46 @@ class ACTORXNODE_OT_AddFile(Operator, ImportHelper):
 
     # ----------------------------------------------------------------------------------------------
     def execute(self, context):
-        from magicattr import get, set
-
-        display_name = f"{Path(self.filepath).stem}_{self.index:01d}"
+        # a separator replace is all the posix conversion needs; the stem falls out of two
+        # right-splits on the normalized string
+        file_path = self.filepath.replace("\\", "/")
+        stem = file_path.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+        display_name = f"{stem}_{self.index:01d}"
 
-        target = get(bpy, f"{self.source_node}.{self.target_prop}")
-        set(target, "file_path", Path(self.filepath).as_posix())
-        set(target, "display_name", display_name)
+        target = _resolve_target(f"{self.source_node}.{self.target_prop}")
+        attr_set(target, "file_path", file_path)
+        attr_set(target, "display_name", display_name)
 
         return {"FINISHED"}
 
 
-# ----------------------------------------------------------------------------------------------
-class ACTORXNODE_OT_AddModelInputSocket(Operator):
-    """add an import socket for model nodes."""
-
-    bl_idname = "actorxnode.add_model_input_socket"
-    bl_label = "Add Model"
-    bl_options = {"UNDO", "PRESET"}
-
-    source_repr: StringProperty(default="", options={"HIDDEN"})
-
-    # ----------------------------------------------------------------------------------------------
-    def execute(self, context):
-        target = get(bpy, self.source_repr)
-
-        new_socket = target.inputs.new(type="ActorXModelSocketIn", name="model_socket")
-        new_socket.display_shape = "CIRCLE"
-
-        return {"FINISHED"}
+# socket rna type and socket name per input kind; one parametric operator replaces the
+# three byte-identical ones that differed only in these strings
+_socket_specs = {
+    "model": ("ActorXModelSocketIn", "model_socket"),
+    "mesh": ("ActorXMeshSocketIn", "mesh_socket"),
+    "animation": ("ActorXAnimationSocketIn", "animation_socket"),
+}
 
 
 # ----------------------------------------------------------------------------------------------
-class ACTORXNODE_OT_AddMeshInputSocket(Operator):
-    """add an import socket for mesh nodes."""
+class ACTORXNODE_OT_AddInputSocket(Operator):
+    """add an import socket of the given kind to the node."""
 
-    bl_idname = "actorxnode.add_mesh_input_socket"
-    bl_label = "Add Mesh"
+    bl_idname = "actorxnode.add_input_socket"
+    bl_label = "Add Input Socket"
     bl_options = {"UNDO", "PRESET"}
 
     source_repr: StringProperty(default="", options={"HIDDEN"})
+    kind: StringProperty(default="", options={"HIDDEN"})
 
     # ----------------------------------------------------------------------------------------------
     def execute(self, context):
-        target = get(bpy, self.source_repr)
-
-        new_socket = target.inputs.new(type="ActorXMeshSocketIn", name="mesh_socket")
-        new_socket.display_shape = "CIRCLE"
-
-        return {"FINISHED"}
+        target = _resolve_target(_resolve_source_repr(self, context))
 
+        socket_type, socket_name = _socket_specs[self.kind]
 
-# ----------------------------------------------------------------------------------------------
-class ACTORXNODE_OT_AddAnimationInputSocket(Operator):
-    """add an import socket for animation nodes."""
-
-    bl_idname = "actorxnode.add_animation_input_socket"
-    bl_label = "Add Animation"
-    bl_options = {"UNDO", "PRESET"}
-
-    source_repr: StringProperty(default="", options={"HIDDEN"})
-
-    # ----------------------------------------------------------------------------------------------
-    def execute(self, context):
-        target = get(bpy, self.source_repr)
-
-        new_socket = target.inputs.new(type="ActorXAnimationSocketIn", name="animation_socket")
+        new_socket = target.inputs.new(type=socket_type, name=socket_name)
         new_socket.display_shape = "CIRCLE"
 
         return {"FINISHED"}
@@ -181,7 +193,7 @@ class ACTORXNODE_OT_RunImport(Operator):
         node_ax_import = bpy.context.scene.node_ax_import
 
         try:
-            walk_import_nodes(context, self.source_repr)
+            walk_import_nodes(context, _resolve_source_repr(self, context))
             node_ax_import["import_status"] = "Finished"
             return {"FINISHED"}
         except MissingImportFileName:
@@ -207,9 +219,7 @@ classes = [
     ACTORXNODE_OT_AddFile,
     ACTORXNODE_OT_AddFolder,
     ACTORXNODE_OT_RunImport,
-    ACTORXNODE_OT_AddModelInputSocket,
-    ACTORXNODE_OT_AddMeshInputSocket,
-    ACTORXNODE_OT_AddAnimationInputSocket,
+    ACTORXNODE_OT_AddInputSocket,
 ]
 
 
@@ -218,8 +228,14 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    if _clear_attr_cache not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_clear_attr_cache)
+
 
 # --------------------------------------------------------------------------------------------------
 def unregister():
+    if _clear_attr_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_clear_attr_cache)
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
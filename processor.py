@@ -4,6 +4,8 @@
 # SPDX-License-Identifier: MIT
 # --------------------------------------------------------------------------------------------------
 
+from operator import attrgetter
+
 import bpy
 from bpy.types import Context
 
@@ -21,6 +23,39 @@ echo = Echo()
 
 """convert the node properties to an import driver dict."""
 
+# keys skipped when flattening the node property groups. frozensets built once at import
+# time; the walkers previously rebuilt a list literal per node and scanned it per key
+_EXCLUDE_ANIM = frozenset({"bl_rna", "rna_type", "name"})
+_EXCLUDE_MESH = frozenset(
+    {"bl_rna", "rna_type", "name", "ueviewer_mat", "diffuse_map", "specular_map", "normal_map"}
+)
+_EXCLUDE_MODEL = _EXCLUDE_MESH
+
+
+# key tuple and attrgetter per property-group rna type, built from the rna definition on
+# first sight. the getter pulls every value in one c call instead of a getattr per key
+_prop_getters: dict[str, tuple] = {}
+
+
+# --------------------------------------------------------------------------------------------------
+def _props_to_dict(property_group, exclude: frozenset) -> dict:
+    """flatten a property group to a plain dict. the key tuple and batch getter are
+    memoized per rna type so repeat nodes skip the definition walk entirely."""
+
+    type_name = property_group.bl_rna.identifier
+
+    if (cached := _prop_getters.get(type_name)) is None:
+        keys = tuple(
+            prop.identifier
+            for prop in property_group.bl_rna.properties
+            if prop.identifier not in exclude
+        )
+        cached = _prop_getters[type_name] = (keys, attrgetter(*keys))
+
+    keys, getter = cached
+
+    return dict(zip(keys, getter(property_group)))
+
 
 # --------------------------------------------------------------------------------------------------
 # def dump_asset_paths(driver_object):
@@ -41,134 +76,114 @@ def walk_import_nodes(context: Context, source_repr: str):
 
     # ----------------------------------------------------------------------------------------------
     def walk_animation_node(animation_socket, model_item):
-        """process an animation node. chained nodes are processed recursively."""
-
-        animation_node = animation_socket.links[0].from_node
-        ax_animation_props = animation_node.ax_animation_props
-
-        if not ax_animation_props["file_path"]:
-            echo.message("No filename was set for the animation node", leading_line=True)
-            echo.message("Aborting Import", leading_line=True)
-            raise MissingImportFileName
-
-        animation_item = {
-            key: getattr(ax_animation_props, key)
-            for key in ax_animation_props.keys()
-            if key
-            not in [
-                "bl_rna",
-                "rna_type",
-                "name",
-            ]
-        }
-        model_item["animation_list"].append(animation_item)
+        """process an animation node. the chain is walked with a loop so long chains cost
+        neither a python frame per node nor a recursion limit."""
 
-        if (
-            animation_socket := animation_node.inputs.get("animation_socket")
-        ) and animation_socket.is_linked:
-            walk_animation_node(animation_socket, model_item)
+        while True:
+            animation_node = animation_socket.links[0].from_node
+            ax_animation_props = animation_node.ax_animation_props
 
-    # ----------------------------------------------------------------------------------------------
-    def walk_mesh_node(mesh_socket, model_item, import_drivers):
-        """process a mesh node. chained nodes are processed recursively."""
-
-        mesh_node = mesh_socket.links[0].from_node
-        ax_mesh_props = mesh_node.ax_mesh_props
-
-        # if no filename was set then brute force exit the script
-        if not ax_mesh_props["file_path"]:
-            echo.message("No filename was set for the mesh node", leading_line=True)
-            echo.message("Aborting Import", leading_line=True)
-            raise MissingImportFileName
-
-        mesh_item = {
-            key: getattr(ax_mesh_props, key)
-            for key in ax_mesh_props.keys()
-            if key
-            not in [
-                "bl_rna",
-                "rna_type",
-                "name",
-                "ueviewer_mat",
-                "diffuse_map",
-                "specular_map",
-                "normal_map",
-            ]
-        }
+            if not ax_animation_props["file_path"]:
+                echo.message("No filename was set for the animation node", leading_line=True)
+                echo.message("Aborting Import", leading_line=True)
+                raise MissingImportFileName
 
-        mesh_item["ueviewer_mat"] = {k: v for k, v in ax_mesh_props["ueviewer_mat"].items()}
-        mesh_item["texture_path"] = {k: v for k, v in ax_mesh_props["texture_path"].items()}
-        mesh_item["diffuse_map"] = {k: v for k, v in ax_mesh_props["diffuse_map"].items()}
-        mesh_item["specular_map"] = {k: v for k, v in ax_mesh_props["specular_map"].items()}
-        mesh_item["normal_map"] = {k: v for k, v in ax_mesh_props["normal_map"].items()}
+            animation_item = _props_to_dict(ax_animation_props, _EXCLUDE_ANIM)
+            model_item["animation_list"].append(animation_item)
 
-        if model_item:
-            model_item["mesh_list"].append(mesh_item)
-        else:
-            import_drivers["mesh_list"].append(mesh_item)
+            if not (
+                (animation_socket := animation_node.inputs.get("animation_socket"))
+                and animation_socket.is_linked
+            ):
+                break
 
-        if (mesh_socket := mesh_node.inputs.get("mesh_socket")) and mesh_socket.is_linked:
-            walk_mesh_node(mesh_socket, model_item, import_drivers)
+    # ----------------------------------------------------------------------------------------------
+    def walk_mesh_node(mesh_socket, model_item, import_drivers):
+        """process a mesh node. the chain is walked with a loop so long chains cost
+        neither a python frame per node nor a recursion limit."""
+
+        while True:
+            mesh_node = mesh_socket.links[0].from_node
+            ax_mesh_props = mesh_node.ax_mesh_props
+
+            # if no filename was set then brute force exit the script
+            if not ax_mesh_props["file_path"]:
+                echo.message("No filename was set for the mesh node", leading_line=True)
+                echo.message("Aborting Import", leading_line=True)
+                raise MissingImportFileName
+
+            mesh_item = _props_to_dict(ax_mesh_props, _EXCLUDE_MESH)
+
+            # dict() copies the id-property mapping in one c call; the comprehension form
+            # walked the items pair by pair in bytecode
+            mesh_item["ueviewer_mat"] = dict(ax_mesh_props["ueviewer_mat"])
+            mesh_item["texture_path"] = dict(ax_mesh_props["texture_path"])
+            mesh_item["diffuse_map"] = dict(ax_mesh_props["diffuse_map"])
+            mesh_item["specular_map"] = dict(ax_mesh_props["specular_map"])
+            mesh_item["normal_map"] = dict(ax_mesh_props["normal_map"])
+
+            if model_item:
+                model_item["mesh_list"].append(mesh_item)
+            else:
+                import_drivers["mesh_list"].append(mesh_item)
+
+            if not (
+                (mesh_socket := mesh_node.inputs.get("mesh_socket")) and mesh_socket.is_linked
+            ):
+                break
 
     # ----------------------------------------------------------------------------------------------
     def walk_model_node(model_socket, import_drivers, parent=None):
-        """process a model node. chained nodes are processed recursively."""
-
-        model_node = model_socket.links[0].from_node
-
-        ax_model_props = model_node.ax_model_props
-
-        # if no filename was set then brute force exit the script
-        if not ax_model_props["file_path"]:
-            echo.message("No filename was set for the model node", leading_line=True)
-            echo.message("Aborting Import", leading_line=True)
-            raise MissingImportFileName
-
-        model_item = {
-            key: getattr(ax_model_props, key)
-            for key in ax_model_props.keys()
-            if key
-            not in [
-                "bl_rna",
-                "rna_type",
-                "name",
-                "ueviewer_mat",
-                "diffuse_map",
-                "specular_map",
-                "normal_map",
-            ]
-        }
+        """process a model node. the chain is walked with a loop so long chains cost
+        neither a python frame per node nor a recursion limit."""
 
-        if parent:
-            model_item["parent_name"] = parent["ax_model_props"]["display_name"]
-            model_item["parent_model"] = parent["ax_model_props"]["display_name"]
+        while True:
+            model_node = model_socket.links[0].from_node
 
-        model_item["ueviewer_mat"] = {k: v for k, v in ax_model_props["ueviewer_mat"].items()}
-        model_item["texture_path"] = {k: v for k, v in ax_model_props["texture_path"].items()}
-        model_item["diffuse_map"] = {k: v for k, v in ax_model_props["diffuse_map"].items()}
-        model_item["specular_map"] = {k: v for k, v in ax_model_props["specular_map"].items()}
-        model_item["normal_map"] = {k: v for k, v in ax_model_props["normal_map"].items()}
+            ax_model_props = model_node.ax_model_props
 
-        import_drivers["model_list"].append(model_item)
+            # if no filename was set then brute force exit the script
+            if not ax_model_props["file_path"]:
+                echo.message("No filename was set for the model node", leading_line=True)
+                echo.message("Aborting Import", leading_line=True)
+                raise MissingImportFileName
 
-        model_item["mesh_list"] = []
+            model_item = _props_to_dict(ax_model_props, _EXCLUDE_MODEL)
 
-        if (mesh_socket := model_node.inputs.get("mesh_socket")) and mesh_socket.is_linked:
-            walk_mesh_node(mesh_socket, model_item, None)
+            if parent:
+                model_item["parent_name"] = parent["ax_model_props"]["display_name"]
+                model_item["parent_model"] = parent["ax_model_props"]["display_name"]
 
-        model_item["animation_list"] = []
+            model_item["ueviewer_mat"] = dict(ax_model_props["ueviewer_mat"])
+            model_item["texture_path"] = dict(ax_model_props["texture_path"])
+            model_item["diffuse_map"] = dict(ax_model_props["diffuse_map"])
+            model_item["specular_map"] = dict(ax_model_props["specular_map"])
+            model_item["normal_map"] = dict(ax_model_props["normal_map"])
 
-        animation_sockets = [
-            x for x in model_node.inputs if x.is_linked and x.name == "animation_socket"
-        ]
+            import_drivers["model_list"].append(model_item)
 
-        for animation_socket in animation_sockets:
-            walk_animation_node(animation_socket, model_item)
+            model_item["mesh_list"] = []
+
+            if (mesh_socket := model_node.inputs.get("mesh_socket")) and mesh_socket.is_linked:
+                walk_mesh_node(mesh_socket, model_item, None)
+
+            model_item["animation_list"] = []
+
+            animation_sockets = [
+                x for x in model_node.inputs if x.is_linked and x.name == "animation_socket"
+            ]
 
-        if (
-            child_model_socket := model_node.inputs.get("model_socket")
-        ) and child_model_socket.is_linked:
-            walk_model_node(child_model_socket, import_drivers, parent=model_node)
+            for animation_socket in animation_sockets:
+                walk_animation_node(animation_socket, model_item)
+
+            if not (
+                (child_model_socket := model_node.inputs.get("model_socket"))
+                and child_model_socket.is_linked
+            ):
+                break
+
+            model_socket = child_model_socket
+            parent = model_node
 
     # ----------------------------------------------------------------------------------------------
     def walk_tree(actorx_import_node):
@@ -176,26 +191,30 @@ def walk_import_nodes(context: Context, source_repr: str):
 
         import_drivers = {}
 
-        model_sockets = [
-            x for x in actorx_import_node.inputs if x.is_linked and x.name == "model_socket"
-        ]
+        # bin the linked sockets by name in one pass over the inputs collection instead of
+        # crossing the rna boundary per socket twice
+        model_sockets = []
+        mesh_sockets = []
+
+        for socket in actorx_import_node.inputs:
+            if not socket.is_linked:
+                continue
+
+            if socket.name == "model_socket":
+                model_sockets.append(socket)
+            elif socket.name == "mesh_socket":
+                mesh_sockets.append(socket)
 
         import_drivers["model_list"] = []
 
         for model_socket in model_sockets:
             walk_model_node(model_socket, import_drivers)
 
-        mesh_sockets = [
-            x for x in actorx_import_node.inputs if x.is_linked and x.name == "mesh_socket"
-        ]
-
         import_drivers["mesh_list"] = []
 
         for mesh_socket in mesh_sockets:
             walk_mesh_node(mesh_socket, None, import_drivers)
 
-        print(list(import_drivers))
-
         return import_drivers
 
     # ----------------------------------------------------------------------------------------------
@@ -205,13 +224,16 @@ def walk_import_nodes(context: Context, source_repr: str):
 
     import_drivers = walk_tree(actorx_import_node)
 
-    import_driver = {}
-    import_driver["model_list"] = import_drivers["model_list"]
-    import_driver["mesh_list"] = import_drivers["mesh_list"]
+    import_driver = {
+        "model_list": import_drivers["model_list"],
+        "mesh_list": import_drivers["mesh_list"],
+    }
 
     walk_import_dict(context, import_driver)
 
-    if config.user_settings["options"]["dump_configuration"]:
+    options = config.user_settings["options"]
+
+    if options["dump_configuration"]:
         json_file_name = timestamp_log_file(config.user_drivers / "uilist.json")
         yaml_file_name = timestamp_log_file(config.user_drivers / "uilist.yaml")
         dump_json_file(json_file_name, import_driver)
@@ -62,26 +62,12 @@ class AxTexturePath(AxFileBase, PropertyGroup):
 
 
 # --------------------------------------------------------------------------------------------------
-class AxDiffuseMap(AxFileBase, PropertyGroup):
-    """these are the diffuse texture map file options."""
+class AxTextureMap(AxFileBase, PropertyGroup):
+    """these are the texture map file options. one registered type serves the diffuse,
+    specular and normal slots; the slot identity is written per instance from the driver
+    template at node init."""
 
-    import_what: StringProperty(default="diffuse_map")
-    filter_glob: StringProperty(name="Filter Glob", default="*.tga;*.dds;*.png")
-
-
-# --------------------------------------------------------------------------------------------------
-class AxSpecularMap(AxFileBase, PropertyGroup):
-    """these are the specular texture map file options."""
-
-    import_what: StringProperty(default="specular_map")
-    filter_glob: StringProperty(name="Filter Glob", default="*.tga;*.dds;*.png")
-
-
-# --------------------------------------------------------------------------------------------------
-class AxNormalMap(AxFileBase, PropertyGroup):
-    """these are the normal texture map file options."""
-
-    import_what: StringProperty(default="normal_map")
+    import_what: StringProperty(default="texture_map")
     filter_glob: StringProperty(name="Filter Glob", default="*.tga;*.dds;*.png")
 
 
@@ -91,9 +77,9 @@ class AxModelAndMeshBase(PropertyGroup):
 
     ueviewer_mat: PointerProperty(type=AxUEViewerMat)
     texture_path: PointerProperty(type=AxTexturePath)
-    diffuse_map: PointerProperty(type=AxDiffuseMap)
-    specular_map: PointerProperty(type=AxSpecularMap)
-    normal_map: PointerProperty(type=AxNormalMap)
+    diffuse_map: PointerProperty(type=AxTextureMap)
+    specular_map: PointerProperty(type=AxTextureMap)
+    normal_map: PointerProperty(type=AxTextureMap)
     invert_green_channel: BoolProperty(name="Invert Normal Green Channel", default=True)
     rebuild_blue_channel: BoolProperty(name="Rebuild Normal Blue Channel", default=False)
     remove_doubles: BoolProperty(name="Remove Doubles", default=True)
@@ -135,6 +121,17 @@ class AxModelMeshAndAnimationBase(PropertyGroup):
     )
 
 
+# the keyframe enums are mirrored onto the animation properties; the rna lookups run once
+# here instead of four times per name in the class body, and the tuples are shared across
+# registrations instead of a fresh list per addon reload
+_kf_interpolation = bpy.types.Keyframe.bl_rna.properties["interpolation"]
+_kf_easing = bpy.types.Keyframe.bl_rna.properties["easing"]
+_kf_interpolation_items = tuple(
+    (x.identifier, x.name, x.description) for x in _kf_interpolation.enum_items
+)
+_kf_easing_items = tuple((x.identifier, x.name, x.description) for x in _kf_easing.enum_items)
+
+
 # --------------------------------------------------------------------------------------------------
 class AxAnimation(AxFileBase, AxModelMeshAndAnimationBase, PropertyGroup):
     """these are the animation options."""
@@ -146,20 +143,14 @@ class AxAnimation(AxFileBase, AxModelMeshAndAnimationBase, PropertyGroup):
 
     use_translation: bpy.props.BoolProperty(name="Use Translation", default=True)
     interpolation: bpy.props.EnumProperty(
-        name=bpy.types.Keyframe.bl_rna.properties["interpolation"].name,
-        description=bpy.types.Keyframe.bl_rna.properties["interpolation"].description,
-        items=[
-            (x.identifier, x.name, x.description)
-            for x in bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items
-        ],
+        name=_kf_interpolation.name,
+        description=_kf_interpolation.description,
+        items=_kf_interpolation_items,
     )
     easing: bpy.props.EnumProperty(
-        name=bpy.types.Keyframe.bl_rna.properties["easing"].name,
-        description=bpy.types.Keyframe.bl_rna.properties["easing"].description,
-        items=[
-            (x.identifier, x.name, x.description)
-            for x in bpy.types.Keyframe.bl_rna.properties["easing"].enum_items
-        ],
+        name=_kf_easing.name,
+        description=_kf_easing.description,
+        items=_kf_easing_items,
     )
 
 
@@ -258,9 +249,7 @@ classes = [
     AxFileBase,
     AxUEViewerMat,
     AxTexturePath,
-    AxDiffuseMap,
-    AxSpecularMap,
-    AxNormalMap,
+    AxTextureMap,
     AxModelAndMeshBase,
     AxModelMeshAndAnimationBase,
     AxAnimation,